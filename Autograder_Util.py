@@ -1,50 +1,184 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import json
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from matplotlib.collections import LineCollection
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson
 
-def load_ref_dataset(file_path, char_list):
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        raw_dataset = f.read()
+
+def load_ref_dataset(file_path, char_list, cache_path=None):
+    """
+    Load reference strokes (medians) for each character in char_list.
+
+    The parsed dataset is cached per file path and modification time (see
+    _load_all_refs), so repeated calls only pay for the dictionary lookups.
+    If cache_path points to a cache written by build_ref_cache that is
+    newer than file_path, the strokes are read from its memory-mapped
+    arrays instead and the JSON is never parsed. Either way the returned
+    strokes are fresh arrays the caller may modify.
+    """
+    if cache_path is not None:
+        index_path = os.path.join(cache_path, "index.npz")
+        if os.path.isfile(index_path):
+            index_mtime = os.stat(index_path).st_mtime_ns
+            if index_mtime >= os.stat(file_path).st_mtime_ns:
+                return _load_refs_from_cache(cache_path, index_mtime, char_list)
+            print(
+                f"Reference cache '{cache_path}' is older than the dataset, ignoring it."
+            )
+
+    refs = _load_all_refs(file_path, os.stat(file_path).st_mtime_ns)
 
     ref_chars = []
     for char in char_list:
-        ref_stroke_dict = get_true_char(char, raw_dataset)
-
-        # Convert dict to list of strokes (no substrokes)
-        ref_strokes = [ref_stroke_dict[i] for i in sorted(ref_stroke_dict.keys())]
-        ref_chars.append(ref_strokes)
+        if char not in refs:
+            print(f"Character '{char}' not found in the dataset.")
+            ref_chars.append(None)
+        else:
+            # The cached strokes are shared and read-only, hand out copies
+            ref_chars.append([stroke.copy() for stroke in refs[char]])
 
     return ref_chars
 
 
-def get_true_char(target_char, raw_dataset):
+def build_ref_cache(file_path, cache_path):
+    """
+    Convert the reference dataset to a binary cache directory.
+
+    The cache holds points.npy, every median point as one (P, 2) float32
+    array that can be memory-mapped, and index.npz with the characters and
+    the offsets of their strokes and points. Both are written to temporary
+    files and moved into place, index.npz last, so arrays that are already
+    memory-mapped keep their old contents and a half-written cache is never
+    picked up.
+    """
+    # Re-read the dataset in case it changed since it was cached
+    _load_all_refs.cache_clear()
+    refs = _load_all_refs(file_path, os.stat(file_path).st_mtime_ns)
+    strokes = [stroke for char_strokes in refs.values() for stroke in char_strokes]
+
+    stroke_counts = [len(char_strokes) for char_strokes in refs.values()]
+    point_counts = [len(stroke) for stroke in strokes]
+    char_offsets = np.concatenate(([0], np.cumsum(stroke_counts))).astype(np.int64)
+    stroke_offsets = np.concatenate(([0], np.cumsum(point_counts))).astype(np.int64)
+
+    if strokes:
+        points = np.concatenate([stroke.reshape(-1, 2) for stroke in strokes])
+    else:
+        points = np.empty((0, 2), dtype=np.float32)
+
+    os.makedirs(cache_path, exist_ok=True)
+    points_path = os.path.join(cache_path, "points.npy")
+    index_path = os.path.join(cache_path, "index.npz")
+
+    with open(points_path + ".tmp", "wb") as f:
+        np.save(f, points.astype(np.float32))
+    with open(index_path + ".tmp", "wb") as f:
+        np.savez(
+            f,
+            characters=np.array(list(refs), dtype=str),
+            char_offsets=char_offsets,
+            stroke_offsets=stroke_offsets,
+        )
+    os.replace(points_path + ".tmp", points_path)
+    os.replace(index_path + ".tmp", index_path)
+
+    _open_ref_cache.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _open_ref_cache(cache_path, index_mtime):
+    """
+    Memory-map a build_ref_cache directory.
+
+    index_mtime (of index.npz) is part of the cache key, so a cache
+    rebuilt by another process is opened afresh.
+    """
+    points = np.load(os.path.join(cache_path, "points.npy"), mmap_mode="r")
+    with np.load(os.path.join(cache_path, "index.npz")) as index:
+        char_index = {char: i for i, char in enumerate(index["characters"])}
+        char_offsets = index["char_offsets"]
+        stroke_offsets = index["stroke_offsets"]
+
+    return points, char_index, char_offsets, stroke_offsets
+
 
-    lines = raw_dataset.strip().split("\n")
+def _load_refs_from_cache(cache_path, index_mtime, char_list):
+    """Read the requested characters from a build_ref_cache directory."""
+    points, char_index, char_offsets, stroke_offsets = _open_ref_cache(
+        cache_path, index_mtime
+    )
 
-    for line in lines:
-        if not line.strip():
+    ref_chars = []
+    for char in char_list:
+        if char not in char_index:
+            print(f"Character '{char}' not found in the dataset.")
+            ref_chars.append(None)
             continue
 
-        temp_data = json.loads(line)
-        if temp_data.get("character") == target_char:
+        i = char_index[char]
+        # Copying each slice pages in only the points of requested strokes
+        ref_chars.append(
+            [
+                np.array(points[stroke_offsets[k] : stroke_offsets[k + 1]])
+                for k in range(char_offsets[i], char_offsets[i + 1])
+            ]
+        )
+
+    return ref_chars
+
+
+@lru_cache(maxsize=4)
+def _load_all_refs(file_path, mtime):
+    """
+    Parse every entry of the reference dataset once, streaming the file.
 
-            orig = get_stroke_dict_from_json(line)
-            return orig
-    print(f"Character '{target_char}' not found in the dataset.")
-    return None
+    mtime (of file_path) is part of the cache key, so an edited dataset is
+    parsed again. The cached stroke arrays are shared between calls and marked
+    read-only so callers cannot corrupt the cache.
+    """
+    refs = {}
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
 
+            data = _json_loads(line)
+            char = data.get("character")
+            if char not in refs:
+                strokes = get_strokes_from_json(data)
+                for stroke in strokes:
+                    stroke.flags.writeable = False
+                refs[char] = strokes
 
-def get_stroke_dict_from_json(json_line):
+    return refs
 
-    data = json.loads(json_line)
-    medians_list = data.get("medians", [])
 
-    return {i: np.array(stroke_points) for i, stroke_points in enumerate(medians_list)}
+def get_strokes_from_json(data):
+    """Convert a parsed dataset entry to a list of strokes (no substrokes)."""
+    return [
+        np.asarray(stroke_points, dtype=np.float32)
+        for stroke_points in data.get("medians", [])
+    ]
 
 
 def load_character_data(csv_path):
@@ -53,23 +187,50 @@ def load_character_data(csv_path):
     chars[character_idx][stroke_idx] = array of points (x, y)
     """
     # Load the CSV - it's comma-separated, not tab-separated
-    df = pd.read_csv(csv_path, encoding="utf-8")
-
-    # Get unique characters (in order of appearance)
-    unique_chars = df["character"].unique()
-
-    chars = []
-
-    for char_name in unique_chars:
-        char_df = df[df["character"] == char_name]
-        unique_strokes = sorted(char_df["stroke"].unique())  # sort to ensure order
-        strokes = []
-
-        for stroke_idx in unique_strokes:
-            stroke_df = char_df[char_df["stroke"] == stroke_idx]
-            points = stroke_df[["x", "y"]].values
-            strokes.append(points)
-        chars.append(strokes)
+    df = pd.read_csv(
+        csv_path,
+        encoding="utf-8",
+        engine="c",
+        usecols=["character", "stroke", "x", "y"],
+        dtype={
+            "character": "category",
+            "stroke": "int32",
+            "x": "float32",
+            "y": "float32",
+        },
+    )
+    if len(df) == 0:
+        # Header only: no characters (the grouping below needs a first row)
+        return [], np.empty(0, dtype=object)
+
+    # Pull the columns out as plain arrays; characters become integer codes
+    # (in order of appearance)
+    char_codes, unique_chars = pd.factorize(df["character"])
+    unique_chars = np.asarray(unique_chars)
+    stroke_ids = df["stroke"].to_numpy()
+    xy = df[["x", "y"]].to_numpy()
+
+    # Order rows by (character, stroke); lexsort is stable, so points keep
+    # their file order within a stroke. Recorded files are usually already
+    # in this order, in which case the sort and the copies are skipped.
+    char_step = np.diff(char_codes)
+    in_order = (char_step > 0) | ((char_step == 0) & (np.diff(stroke_ids) >= 0))
+    if not in_order.all():
+        order = np.lexsort((stroke_ids, char_codes))
+        char_codes, stroke_ids, xy = char_codes[order], stroke_ids[order], xy[order]
+
+    # A new stroke starts wherever the (character, stroke) pair changes
+    changes = (np.diff(char_codes) != 0) | (np.diff(stroke_ids) != 0)
+    stroke_starts = np.concatenate(([0], np.flatnonzero(changes) + 1))
+    strokes = np.split(xy, stroke_starts[1:])
+
+    # Strokes are grouped by character code, so each character is a slice
+    char_bounds = np.searchsorted(
+        char_codes[stroke_starts], np.arange(len(unique_chars) + 1)
+    )
+    chars = [
+        strokes[start:end] for start, end in zip(char_bounds[:-1], char_bounds[1:])
+    ]
 
     return chars, unique_chars
 
@@ -87,6 +248,98 @@ def resample_stroke(points, target_num=50):
     return np.column_stack((resampled_x, resampled_y))
 
 
+def _resample_flat_kernel(pts, starts, lengths, target_num):
+    """
+    Arc-length resampling of strokes stored back to back in pts.
+
+    Walks each stroke once to accumulate distances, then advances a
+    single segment pointer while emitting the target points, so the
+    cost is O(n + target_num) per stroke with no temporaries.
+    Compiled with numba when available.
+    """
+    n_strokes = starts.shape[0]
+    out = np.empty((n_strokes, target_num, 2))
+
+    for s in prange(n_strokes):
+        a = starts[s]
+        n = lengths[s]
+
+        cum = np.empty(n)
+        cum[0] = 0.0
+        for i in range(1, n):
+            dx = pts[a + i, 0] - pts[a + i - 1, 0]
+            dy = pts[a + i, 1] - pts[a + i - 1, 1]
+            cum[i] = cum[i - 1] + np.sqrt(dx * dx + dy * dy)
+        total = cum[n - 1]
+
+        j = 0
+        for i in range(target_num):
+            t = total * i / (target_num - 1) if target_num > 1 else 0.0
+            while j < n - 2 and cum[j + 1] <= t:
+                j += 1
+            span = cum[j + 1] - cum[j]
+            frac = (t - cum[j]) / span if span > 0 else 0.0
+            out[s, i, 0] = pts[a + j, 0] + frac * (pts[a + j + 1, 0] - pts[a + j, 0])
+            out[s, i, 1] = pts[a + j, 1] + frac * (pts[a + j + 1, 1] - pts[a + j, 1])
+
+    return out
+
+
+if njit is not None:
+    _resample_flat_nb = njit(cache=True, fastmath=True, parallel=True)(
+        _resample_flat_kernel
+    )
+else:
+    _resample_flat_nb = None
+
+
+def _resample_batch(strokes, target_num=50):
+    """
+    Resample many strokes at once by arc length.
+
+    All strokes are concatenated into one (P, 2) array so the segment
+    lengths, cumulative distances and interpolation are computed with a
+    handful of vectorized calls instead of per-stroke np.interp.
+
+    Args:
+        strokes: list of (n_i, 2) arrays, each with at least 2 points
+        target_num: number of points per resampled stroke
+
+    Returns:
+        (len(strokes), target_num, 2) array of resampled strokes
+    """
+    lengths = np.array([len(s) for s in strokes])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    ends = starts + lengths
+    pts = np.concatenate(strokes).astype(np.float64, copy=False)
+
+    if _resample_flat_nb is not None:
+        return _resample_flat_nb(pts, starts, lengths, target_num)
+
+    # Segment lengths; the segment joining two strokes contributes nothing
+    seg = np.sqrt((np.diff(pts, axis=0) ** 2).sum(axis=1))
+    seg[starts[1:] - 1] = 0
+    cum = np.concatenate(([0.0], np.cumsum(seg)))
+    cum -= np.repeat(cum[starts], lengths)
+    total = cum[ends - 1]
+
+    # Shift every stroke past the previous one so a single searchsorted
+    # over the whole array finds the segment for every target distance
+    shift = np.concatenate(([0.0], np.cumsum(total + 1)[:-1]))
+    cum += np.repeat(shift, lengths)
+    target = np.linspace(0, 1, target_num) * total[:, None] + shift[:, None]
+
+    idx = np.searchsorted(cum, target, side="right") - 1
+    idx = np.clip(idx, starts[:, None], ends[:, None] - 2)
+
+    c0 = cum[idx]
+    span = cum[idx + 1] - c0
+    frac = np.divide(target - c0, span, out=np.zeros_like(span), where=span > 0)
+
+    p0 = pts[idx]
+    return p0 + frac[..., None] * (pts[idx + 1] - p0)
+
+
 def resample_characters(chars, num_pts=50):
     """
     Resample all strokes in all characters to have num_pts points.
@@ -98,18 +351,68 @@ def resample_characters(chars, num_pts=50):
     Returns:
         resampled_chars: same structure with resampled strokes
     """
-    resampled_chars = []
-
-    for char_strokes in chars:
-        resampled_strokes = []
-        for stroke in char_strokes:
-            resampled = resample_stroke(stroke, target_num=num_pts)
-            resampled_strokes.append(resampled)
-        resampled_chars.append(resampled_strokes)
+    # Strokes with fewer than 2 points cannot be resampled and are kept as
+    # float copies, so every returned stroke is a fresh array
+    resampled_chars = [
+        [
+            np.array(stroke, dtype=np.float64) if len(stroke) < 2 else stroke
+            for stroke in char_strokes
+        ]
+        for char_strokes in chars
+    ]
+
+    positions = [
+        (i, j)
+        for i, char_strokes in enumerate(resampled_chars)
+        for j, stroke in enumerate(char_strokes)
+        if len(stroke) >= 2
+    ]
+    if not positions:
+        return resampled_chars
+
+    resampled = _resample_batch(
+        [resampled_chars[i][j] for i, j in positions], target_num=num_pts
+    )
+    for (i, j), stroke in zip(positions, resampled):
+        resampled_chars[i][j] = stroke
 
     return resampled_chars
 
 
+def resample_characters_dense(chars, num_pts=50):
+    """
+    Resample all characters into one contiguous float32 tensor.
+
+    Args:
+        chars: list of chars, each char is a list of strokes (numpy arrays)
+        num_pts: target number of points per stroke
+
+    Returns:
+        data: (C, S_max, num_pts, 2) float32 array; the strokes of
+            character i are data[i, :stroke_counts[i]], the rest is NaN.
+            Single-point strokes are repeated to fill num_pts and empty
+            strokes are left NaN, so they do not count towards the
+            character's bounds in normalize_dense.
+        stroke_counts: (C,) int32 number of strokes per character
+    """
+    stroke_counts = np.array([len(char_strokes) for char_strokes in chars], np.int32)
+    s_max = stroke_counts.max(initial=0)
+    data = np.full((len(chars), s_max, num_pts, 2), np.nan, dtype=np.float32)
+
+    strokes = [stroke for char_strokes in chars for stroke in char_strokes]
+    flat = np.empty((len(strokes), num_pts, 2), dtype=np.float32)
+    long_idx = [k for k, stroke in enumerate(strokes) if len(stroke) >= 2]
+    short_idx = [k for k, stroke in enumerate(strokes) if len(stroke) < 2]
+
+    if long_idx:
+        flat[long_idx] = _resample_batch([strokes[k] for k in long_idx], num_pts)
+    for k in short_idx:
+        flat[k] = strokes[k][0] if len(strokes[k]) else np.nan
+
+    data[np.arange(s_max) < stroke_counts[:, None]] = flat
+    return data, stroke_counts
+
+
 def invert_y_axis(chars):
     """
     Invert y-axis for all characters.
@@ -124,14 +427,13 @@ def invert_y_axis(chars):
 
     for char_strokes in chars:
         # Find global y bounds across all strokes in this character
-        all_points = np.vstack(char_strokes)
-        max_y = np.max(all_points[:, 1])
-        min_y = np.min(all_points[:, 1])
+        max_y = max(stroke[:, 1].max() for stroke in char_strokes)
+        min_y = min(stroke[:, 1].min() for stroke in char_strokes)
 
         inverted_strokes = []
         for stroke in char_strokes:
             new_stroke = stroke.copy()
-            new_stroke[:, 1] = max_y + min_y - new_stroke[:, 1]
+            np.subtract(max_y + min_y, stroke[:, 1], out=new_stroke[:, 1])
             inverted_strokes.append(new_stroke)
 
         inverted_chars.append(inverted_strokes)
@@ -142,15 +444,28 @@ def invert_y_axis(chars):
 import numpy as np
 
 
-def normalize_character(chars, target_scale=1.0):
+def normalize_character(chars, target_scale=1.0, flip_y=False):
+    """
+    Center each character in a target_scale square, preserving aspect ratio.
+
+    Args:
+        chars: list of chars, each char is a list of strokes (numpy arrays)
+        target_scale: size of the square the characters are fit into
+        flip_y: also invert the y-axis. Normalized y bounds always sum to
+            target_scale, so this is folded into the scaling (a negated y
+            divisor) and gives the same result as invert_y_axis afterwards
+            without a second pass.
 
+    Returns:
+        normalized_chars: same structure with normalized strokes
+    """
     normalized_chars = []
 
     for char_strokes in chars:
-        # Find bounds across all strokes in this character
-        all_points = np.vstack(char_strokes)
-        min_coords = np.min(all_points, axis=0)
-        max_coords = np.max(all_points, axis=0)
+        # Find bounds across all strokes in this character from per-stroke
+        # bounds, without concatenating every point
+        min_coords = np.min([stroke.min(axis=0) for stroke in char_strokes], axis=0)
+        max_coords = np.max([stroke.max(axis=0) for stroke in char_strokes], axis=0)
 
         size = max_coords - min_coords
         max_dim = np.max(size)
@@ -159,11 +474,14 @@ def normalize_character(chars, target_scale=1.0):
 
         char_midpoint = min_coords + (size / 2)
         target_midpoint = np.array([target_scale / 2, target_scale / 2])
+        divisor = np.array([max_dim, -max_dim if flip_y else max_dim])
 
         normalized_strokes = []
         for stroke in char_strokes:
-            centered_at_zero = stroke - char_midpoint
-            norm_stroke = (centered_at_zero / max_dim * target_scale) + target_midpoint
+            norm_stroke = stroke - char_midpoint
+            np.divide(norm_stroke, divisor, out=norm_stroke)
+            np.multiply(norm_stroke, target_scale, out=norm_stroke)
+            np.add(norm_stroke, target_midpoint, out=norm_stroke)
             normalized_strokes.append(norm_stroke)
 
         normalized_chars.append(normalized_strokes)
@@ -171,14 +489,90 @@ def normalize_character(chars, target_scale=1.0):
     return normalized_chars
 
 
-def preprocess_characters(chars, num_pts=50, target_scale=1.0, flip_y=True):
-    processed = resample_characters(chars, num_pts=num_pts)
-    processed = normalize_character(processed, target_scale=target_scale)
+def normalize_dense(data, target_scale=1.0, flip_y=False):
+    """
+    Normalize (and optionally flip) a dense character tensor in place.
+
+    Same result as normalize_character followed by invert_y_axis: after
+    normalization the y bounds sum to target_scale, so the flip is just a
+    negated y scale, and both are applied as one multiply-add.
+
+    Args:
+        data: (C, S_max, num_pts, 2) array from resample_characters_dense
+        target_scale: size of the square the characters are fit into
+        flip_y: whether to invert the y-axis
+
+    Returns:
+        data, normalized in place
+    """
+    if data.size == 0:
+        return data
+
+    flat = data.reshape(data.shape[0], -1, 2)
+    min_coords = np.nanmin(flat, axis=1)
+    max_coords = np.nanmax(flat, axis=1)
+
+    size = max_coords - min_coords
+    max_dim = size.max(axis=1)
+    max_dim[max_dim == 0] = 1
+
+    char_midpoint = min_coords + (size / 2)
+    factor = target_scale / max_dim
+    scale = np.stack([factor, -factor if flip_y else factor], axis=1)
+    offset = target_scale / 2 - char_midpoint * scale
+
+    data *= scale[:, None, None, :].astype(data.dtype, copy=False)
+    data += offset[:, None, None, :].astype(data.dtype, copy=False)
+    return data
+
 
-    if flip_y:
-        processed = invert_y_axis(processed)
+def unpack_dense(data, stroke_counts):
+    """Convert a dense character tensor back to lists of stroke views."""
+    return [list(data[i, :n]) for i, n in enumerate(stroke_counts)]
 
-    return processed
+
+def _preprocess_chunk(chars, num_pts, target_scale, flip_y):
+    data, stroke_counts = resample_characters_dense(chars, num_pts=num_pts)
+    normalize_dense(data, target_scale=target_scale, flip_y=flip_y)
+    return unpack_dense(data, stroke_counts)
+
+
+def preprocess_characters(
+    chars, num_pts=50, target_scale=1.0, flip_y=True, n_jobs=1, batch_size=64
+):
+    """
+    Resample, normalize and optionally flip the y-axis of all characters.
+
+    Characters are resampled into one dense float32 tensor and normalized
+    there in a single vectorized pass; the returned strokes are views
+    into that tensor.
+
+    Args:
+        n_jobs: number of threads to split the characters over (-1 for
+            all cores). Characters are independent, so batches of at
+            least batch_size characters are processed concurrently; NumPy
+            releases the GIL for the heavy work. Ignored when numba is
+            installed, since the compiled resampler already uses every core.
+        batch_size: minimum number of characters per thread
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    if n_jobs == 1 or _resample_flat_nb is not None or len(chars) <= batch_size:
+        return _preprocess_chunk(chars, num_pts, target_scale, flip_y)
+
+    chunk = max(batch_size, -(-len(chars) // n_jobs))
+    batches = [chars[i : i + chunk] for i in range(0, len(chars), chunk)]
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        results = executor.map(
+            _preprocess_chunk,
+            batches,
+            repeat(num_pts),
+            repeat(target_scale),
+            repeat(flip_y),
+        )
+        return [char_strokes for result in results for char_strokes in result]
 
 
 def plot_character(strokes, flip=True, padding_ratio=0.1):
@@ -234,3 +628,65 @@ def plot_character(strokes, flip=True, padding_ratio=0.1):
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     plt.show()
+
+
+def plot_characters(chars, flip=True, padding_ratio=0.1, ncols=4):
+    """
+    Plot many characters on one figure, one subplot per character.
+
+    Each character is drawn with one LineCollection for all of its strokes
+    and one scatter for all of its points, instead of a plt.plot call per
+    stroke. To redraw with new strokes, reuse the returned collections:
+    lines.set_segments(new_strokes) and points.set_offsets(np.vstack(new_strokes)).
+
+    Args:
+        chars: list of chars, each char is a list of strokes (n_points, 2)
+        flip: whether to invert y-axis
+        padding_ratio: padding around each character as ratio of max dimension
+        ncols: number of subplot columns
+
+    Returns:
+        fig: the matplotlib Figure
+        collections: list of (LineCollection, PathCollection) per character
+    """
+    ncols = max(1, min(ncols, len(chars)))
+    nrows = max(1, -(-len(chars) // ncols))
+    fig, axes = plt.subplots(
+        nrows, ncols, figsize=(3.5 * ncols, 3.5 * nrows), squeeze=False
+    )
+
+    collections = []
+    for ax, strokes in zip(axes.flat, chars):
+        colors = plt.cm.jet(np.linspace(0, 1, len(strokes)))
+        lines = LineCollection(strokes, colors=colors)
+        ax.add_collection(lines)
+
+        point_colors = np.repeat(colors, [len(stroke) for stroke in strokes], axis=0)
+        all_points = np.vstack(strokes)
+        points = ax.scatter(all_points[:, 0], all_points[:, 1], c=point_colors, s=9)
+        collections.append((lines, points))
+
+        # Square bounds with padding, as in plot_character
+        x_min, y_min = all_points.min(axis=0)
+        x_max, y_max = all_points.max(axis=0)
+        max_dim = max(x_max - x_min, y_max - y_min)
+        if max_dim == 0:
+            max_dim = 1
+
+        mid_x, mid_y = (x_max + x_min) / 2, (y_max + y_min) / 2
+        half_size = (max_dim / 2) + max_dim * padding_ratio
+
+        ax.set_xlim(mid_x - half_size, mid_x + half_size)
+        ax.set_ylim(mid_y - half_size, mid_y + half_size)
+        ax.set_aspect("equal", adjustable="box")
+        if flip:
+            ax.invert_yaxis()
+        ax.grid(True, alpha=0.3)
+
+    for ax in axes.flat[len(chars) :]:
+        ax.axis("off")
+
+    fig.tight_layout()
+    plt.show()
+
+    return fig, collections
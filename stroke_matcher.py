@@ -17,11 +17,21 @@ Usage:
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, Optional
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Tuple, Dict, Optional, Union
+from collections import OrderedDict
 from dataclasses import dataclass
-from copy import deepcopy
+from itertools import repeat
 import warnings
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 @dataclass
 class StrokeFeatures:
     """Computed features for a single stroke"""
@@ -30,7 +40,30 @@ class StrokeFeatures:
     angle: float        # Orientation angle from vertical
     start_point: np.ndarray  # (2,) first point
     end_point: np.ndarray    # (2,) last point
-    points: np.ndarray  # (2, n) original points
+    points: Optional[np.ndarray] = None  # (2, n) original points, only kept on request
+
+@dataclass
+class PreparedFeatures:
+    """Features for a set of strokes, stacked into arrays (one row per stroke)"""
+    centers: np.ndarray    # (N, 2) centers of mass
+    lengths: np.ndarray    # (N,) arc lengths
+    angles: np.ndarray     # (N,) orientation angles from vertical
+    rel_dists: np.ndarray  # (N,) center distance from the centers' bounding box top-left
+    start_points: np.ndarray  # (N, 2) first points
+    end_points: np.ndarray    # (N, 2) last points
+    
+    def __len__(self) -> int:
+        return len(self.lengths)
+    
+    def __getitem__(self, i: int) -> StrokeFeatures:
+        """Features of stroke i as a StrokeFeatures (without points)"""
+        return StrokeFeatures(
+            center=self.centers[i],
+            length=self.lengths[i],
+            angle=self.angles[i],
+            start_point=self.start_points[i],
+            end_point=self.end_points[i]
+        )
 
 class StrokeNormalizer:
     """Normalize stroke coordinates to standard space"""
@@ -38,35 +71,27 @@ class StrokeNormalizer:
     def __init__(self, target_size: float = 100.0):
         self.target_size = target_size
         
-    def normalize(self, strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
+    def compute_metadata(self, strokes: List[np.ndarray]) -> Dict:
         """
-        Normalize strokes to [0, target_size] range while preserving aspect ratio
+        Compute the bounding box and scale that normalize() applies
         
         Args:
             strokes: List of (2, 50) or (k, 50) arrays where first 2 rows are x, y
             
         Returns:
-            normalized_strokes: List of normalized arrays
-            metadata: Dict with normalization parameters for denormalization
+            metadata: Dict with normalization parameters (empty for no strokes)
         """
         if len(strokes) == 0:
-            return [], {}
+            return {}
         
-        # Extract all x, y coordinates
-        all_x = []
-        all_y = []
         for stroke in strokes:
             if stroke.shape[0] < 2:
                 raise ValueError(f"Stroke must have at least 2 rows (x, y), got shape {stroke.shape}")
-            all_x.extend(stroke[0, :])
-            all_y.extend(stroke[1, :])
-        
-        all_x = np.array(all_x)
-        all_y = np.array(all_y)
         
-        # Get bounding box
-        x_min, x_max = all_x.min(), all_x.max()
-        y_min, y_max = all_y.min(), all_y.max()
+        # Get bounding box over all x, y coordinates
+        all_xy = np.concatenate([stroke[:2, :] for stroke in strokes], axis=1)
+        x_min, y_min = all_xy.min(axis=1)
+        x_max, y_max = all_xy.max(axis=1)
         
         # Calculate scale to fit in target_size while preserving aspect ratio
         width = x_max - x_min
@@ -81,15 +106,7 @@ class StrokeNormalizer:
         else:
             scale = self.target_size / max(width, height)
         
-        # Normalize each stroke
-        normalized = []
-        for stroke in strokes:
-            norm_stroke = stroke.copy()
-            norm_stroke[0, :] = (stroke[0, :] - x_min) * scale
-            norm_stroke[1, :] = (stroke[1, :] - y_min) * scale
-            normalized.append(norm_stroke)
-        
-        metadata = {
+        return {
             'x_min': x_min,
             'y_min': y_min,
             'x_max': x_max,
@@ -98,18 +115,43 @@ class StrokeNormalizer:
             'width': width,
             'height': height
         }
+    
+    def normalize(self, strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
+        """
+        Normalize strokes to [0, target_size] range while preserving aspect ratio
+        
+        Args:
+            strokes: List of (2, 50) or (k, 50) arrays where first 2 rows are x, y
+            
+        Returns:
+            normalized_strokes: List of normalized arrays
+            metadata: Dict with normalization parameters for denormalization
+        """
+        metadata = self.compute_metadata(strokes)
+        if not metadata:
+            return [], {}
+        
+        # Normalize each stroke
+        offset = np.array([[metadata['x_min']], [metadata['y_min']]])
+        scale = metadata['scale']
+        normalized = []
+        for stroke in strokes:
+            norm_stroke = stroke.copy()
+            norm_stroke[:2, :] = (stroke[:2, :] - offset) * scale
+            normalized.append(norm_stroke)
         
         return normalized, metadata
 
 class StrokeFeatureExtractor:
     """Extract features from normalized strokes"""
     
-    def extract(self, stroke: np.ndarray) -> StrokeFeatures:
+    def extract(self, stroke: np.ndarray, store_points: bool = False) -> StrokeFeatures:
         """
         Extract features from a single stroke
         
         Args:
             stroke: (2, n) or (k, n) array, uses first 2 rows as x, y
+            store_points: Keep the x, y rows on the features (e.g. for plotting)
             
         Returns:
             StrokeFeatures object
@@ -144,7 +186,65 @@ class StrokeFeatureExtractor:
             angle=angle,
             start_point=start,
             end_point=end,
-            points=stroke[:2, :]  # Store only x, y
+            points=stroke[:2, :] if store_points else None  # Store only x, y
+        )
+    
+    def extract_batch(self, strokes: List[np.ndarray],
+                      metadata: Optional[Dict] = None) -> PreparedFeatures:
+        """
+        Extract features from all strokes at once
+        
+        Features are extracted from the raw coordinates. If normalization
+        metadata is given, centers, lengths and end points are then shifted
+        and scaled, giving the features of the normalized strokes without
+        materializing them (angles are unchanged by the transform).
+        
+        Args:
+            strokes: List of (2, n) or (k, n) arrays with the same n,
+                    uses first 2 rows as x, y
+            metadata: Normalization parameters from StrokeNormalizer.compute_metadata
+            
+        Returns:
+            PreparedFeatures with one row per stroke
+        """
+        if len(strokes) == 0:
+            return _prepare([])
+        
+        if metadata:
+            offset = np.array([metadata['x_min'], metadata['y_min']], dtype=float)
+            scale = metadata['scale']
+        else:
+            offset = np.zeros(2)
+            scale = 1.0
+        
+        if len(set(s.shape[1] for s in strokes)) > 1:
+            # Ragged point counts cannot be stacked, extract one by one
+            return _prepare([self.extract((s[:2, :] - offset[:, None]) * scale)
+                             for s in strokes])
+        
+        arr = np.stack([s[:2, :] for s in strokes]).astype(float)  # (N, 2, n)
+        
+        # Center of mass
+        centers = (arr.mean(axis=2) - offset) * scale
+        
+        # Arc length
+        diffs = np.diff(arr, axis=2)
+        lengths = np.sqrt((diffs**2).sum(axis=1)).sum(axis=1) * scale
+        
+        # Angle from vertical (using start to end vector)
+        starts = (arr[:, :, 0] - offset) * scale
+        ends = (arr[:, :, -1] - offset) * scale
+        vec = arr[:, :, -1] - arr[:, :, 0]
+        angles = np.where(np.linalg.norm(vec, axis=1) * scale > 1e-6,
+                          np.arctan2(vec[:, 0], vec[:, 1]), 0.0)
+        
+        return PreparedFeatures(
+            centers=centers,
+            lengths=lengths,
+            angles=angles,
+            rel_dists=_relative_distances(centers),
+            start_points=starts,
+            end_points=ends
         )
 
 class FitnessFunction:
@@ -160,8 +260,8 @@ class FitnessFunction:
         self.epsilon = epsilon
         
     def compute_distance(self, 
-                        written_features: List[StrokeFeatures],
-                        reference_features: List[StrokeFeatures],
+                        written_features: Union[List[StrokeFeatures], PreparedFeatures],
+                        reference_features: Union[List[StrokeFeatures], PreparedFeatures],
                         mapping: List[int]) -> float:
         """
         Compute total distance for a given mapping
@@ -175,63 +275,227 @@ class FitnessFunction:
         Returns:
             Total distance (lower is better)
         """
-        total_distance = 0.0
+        written, reference = self.prepare(written_features, reference_features)
+        
+        return float(_mapping_distance(
+            np.asarray(mapping, dtype=np.int64), written.centers, reference.centers,
+            written.lengths, reference.lengths,
+            written.angles, reference.angles,
+            written.rel_dists, reference.rel_dists,
+            self.alpha, self.beta, self.gamma, self.epsilon, np.inf
+        ))
+    
+    def prepare(self,
+                written_features: Union[List[StrokeFeatures], PreparedFeatures],
+                reference_features: Union[List[StrokeFeatures], PreparedFeatures]
+                ) -> Tuple[PreparedFeatures, PreparedFeatures]:
+        """
+        Precompute the mapping-independent parts of the distance
         
-        # Get reference bounding box top-left for relative position calculation
-        if len(reference_features) > 0:
-            ref_centers = np.array([f.center for f in reference_features])
-            ref_bbox_tl = np.array([ref_centers[:, 0].min(), ref_centers[:, 1].min()])
-        else:
-            ref_bbox_tl = np.zeros(2)
+        Centers, lengths, angles and relative distances only depend on the
+        features, so they are stacked once per GA run instead of once per
+        chromosome. Already prepared features are passed through.
         
-        # Get written bounding box top-left
-        if len(written_features) > 0:
-            written_centers = np.array([f.center for f in written_features])
-            written_bbox_tl = np.array([written_centers[:, 0].min(), written_centers[:, 1].min()])
-        else:
-            written_bbox_tl = np.zeros(2)
+        Returns:
+            (written, reference) PreparedFeatures
+        """
+        return _prepare(written_features), _prepare(reference_features)
+    
+    def compute_population_distance(self,
+                                    written: PreparedFeatures,
+                                    reference: PreparedFeatures,
+                                    mapping_matrix: np.ndarray,
+                                    parallel: bool = True,
+                                    threshold: float = np.inf) -> np.ndarray:
+        """
+        Compute total distance for every mapping in a population at once
         
-        for written_idx, ref_idx in enumerate(mapping):
-            written_feat = written_features[written_idx]
-            
-            # No match (extra stroke) - high penalty
-            if ref_idx == 0 or ref_idx > len(reference_features):
-                total_distance += 1000.0
-                continue
-            
-            ref_feat = reference_features[ref_idx - 1]  # mapping uses 1-indexed
-            
-            # 1. Center of mass distance (global feature)
-            d_center = np.linalg.norm(written_feat.center - ref_feat.center)
-            
-            # 2. Length difference (partial feature)
-            d_length = abs(written_feat.length - ref_feat.length)
-            
-            # 3. Angle difference (partial feature)
-            d_angle = abs(written_feat.angle - ref_feat.angle)
-            # Normalize angle difference to [0, pi]
-            if d_angle > np.pi:
-                d_angle = 2 * np.pi - d_angle
-            
-            # 4. Relative position distance (partial feature)
-            written_rel_dist = np.linalg.norm(written_feat.center - written_bbox_tl)
-            ref_rel_dist = np.linalg.norm(ref_feat.center - ref_bbox_tl)
-            d_relative = abs(written_rel_dist - ref_rel_dist)
-            
-            # Weighted sum
-            distance = (self.alpha * d_center + 
-                       self.beta * d_length + 
-                       self.gamma * d_angle + 
-                       self.epsilon * d_relative)
+        Same result as compute_distance applied to each row, but evaluated
+        over the whole population in one call.
+        
+        Args:
+            written: Prepared features for written strokes (see prepare)
+            reference: Prepared features for reference strokes
+            mapping_matrix: (P, n_written) int array, one mapping per row
+            parallel: Use the multithreaded numba kernel (disable when
+                     already running inside a worker pool)
+            threshold: With numba, a mapping stops accumulating once its
+                      distance exceeds this and reports that partial sum,
+                      which is still above the threshold
             
-            total_distance += distance
+        Returns:
+            (P,) array of total distances (lower is better)
+        """
+        mapping = np.asarray(mapping_matrix)
+        n_reference = len(reference)
+        
+        if _population_distance_nb is not None:
+            kernel = _population_distance_nb if parallel else _population_distance_serial_nb
+            return kernel(
+                mapping, written.centers, reference.centers,
+                written.lengths, reference.lengths,
+                written.angles, reference.angles,
+                written.rel_dists, reference.rel_dists,
+                self.alpha, self.beta, self.gamma, self.epsilon, threshold
+            )
+        
+        # No match (extra stroke) - high penalty
+        valid = (mapping > 0) & (mapping <= n_reference)
+        if n_reference == 0:
+            return np.full(mapping.shape[0], 1000.0 * mapping.shape[1])
+        
+        idx = np.clip(mapping - 1, 0, n_reference - 1)  # mapping uses 1-indexed
+        
+        # 1. Center of mass distance (global feature)
+        d_center = np.linalg.norm(
+            written.centers[None, :, :] - reference.centers[idx], axis=2
+        )
+        
+        # 2. Length difference (partial feature)
+        d_length = np.abs(written.lengths - reference.lengths[idx])
         
-        return total_distance
+        # 3. Angle difference (partial feature), normalized to [0, pi]
+        d_angle = np.abs(written.angles - reference.angles[idx])
+        d_angle = np.where(d_angle > np.pi, 2 * np.pi - d_angle, d_angle)
+        
+        # 4. Relative position distance (partial feature)
+        d_relative = np.abs(written.rel_dists - reference.rel_dists[idx])
+        
+        # Weighted sum
+        distance = (self.alpha * d_center +
+                    self.beta * d_length +
+                    self.gamma * d_angle +
+                    self.epsilon * d_relative)
+        
+        return np.where(valid, distance, 1000.0).sum(axis=1)
     
     def compute_fitness(self, distance: float) -> float:
         """Convert distance to fitness (higher is better)"""
         return 1.0 / (1.0 + distance)
 
+
+def _mapping_distance_kernel(mapping, written_centers, ref_centers,
+                             written_lens, ref_lens, written_angles, ref_angles,
+                             written_rel, ref_rel, alpha, beta, gamma, epsilon,
+                             threshold):
+    """
+    Total distance of a single mapping, in scalar loops
+    
+    α·d_center + β·d_length + γ·d_angle + ε·d_relative per matched stroke,
+    written so numba can compile it to a tight loop with no temporaries.
+    Stops early once the running total exceeds threshold (branch and
+    bound), returning the partial total.
+    """
+    n_reference = ref_lens.shape[0]
+    total = 0.0
+    for i in range(mapping.shape[0]):
+        j = mapping[i] - 1  # mapping uses 1-indexed
+        
+        # No match (extra stroke) - high penalty
+        if j < 0 or j >= n_reference:
+            total += 1000.0
+            if total > threshold:
+                break
+            continue
+        
+        dx = written_centers[i, 0] - ref_centers[j, 0]
+        dy = written_centers[i, 1] - ref_centers[j, 1]
+        d_center = np.sqrt(dx * dx + dy * dy)
+        d_length = abs(written_lens[i] - ref_lens[j])
+        d_angle = abs(written_angles[i] - ref_angles[j])
+        if d_angle > np.pi:
+            d_angle = 2 * np.pi - d_angle
+        d_relative = abs(written_rel[i] - ref_rel[j])
+        
+        total += alpha * d_center + beta * d_length + gamma * d_angle + epsilon * d_relative
+        if total > threshold:
+            break
+    
+    return total
+
+
+def _population_distance_kernel(mapping_matrix, written_centers, ref_centers,
+                                written_lens, ref_lens, written_angles, ref_angles,
+                                written_rel, ref_rel, alpha, beta, gamma, epsilon,
+                                threshold):
+    """Total distance of every row of mapping_matrix, one chromosome per thread"""
+    n_population = mapping_matrix.shape[0]
+    out = np.empty(n_population)
+    for p in prange(n_population):
+        out[p] = _mapping_distance(mapping_matrix[p], written_centers, ref_centers,
+                                   written_lens, ref_lens, written_angles, ref_angles,
+                                   written_rel, ref_rel, alpha, beta, gamma, epsilon,
+                                   threshold)
+    return out
+
+
+# Fast-math flags for the distance kernels, without 'ninf'/'nnan': the
+# threshold is np.inf by default, and comparing against it under 'ninf'
+# is undefined
+_FASTMATH = {'contract', 'arcp', 'reassoc', 'afn'}
+
+if njit is not None:
+    _mapping_distance = njit(cache=True, fastmath=_FASTMATH)(_mapping_distance_kernel)
+    _population_distance_nb = njit(cache=True, fastmath=_FASTMATH, parallel=True)(
+        _population_distance_kernel
+    )
+    _population_distance_serial_nb = njit(cache=True, fastmath=_FASTMATH)(
+        _population_distance_kernel
+    )
+else:
+    _mapping_distance = _mapping_distance_kernel
+    _population_distance_nb = None
+    _population_distance_serial_nb = None
+
+
+def _evaluate_chunk(fitness_func: FitnessFunction,
+                    written: PreparedFeatures,
+                    reference: PreparedFeatures,
+                    mapping_matrix: np.ndarray,
+                    threshold: float = np.inf) -> np.ndarray:
+    """Distances for a chunk of chromosomes, module-level so it pickles for worker processes"""
+    return fitness_func.compute_population_distance(written, reference, mapping_matrix,
+                                                    parallel=False, threshold=threshold)
+
+
+# Process pools for n_workers > 1, by worker count, started on first use and
+# shared by every GeneticAlgorithm so matches don't each pay the startup
+_PROCESS_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _shared_process_pool(n_workers: int) -> ProcessPoolExecutor:
+    """The module's process pool with n_workers workers, started lazily"""
+    pool = _PROCESS_POOLS.get(n_workers)
+    if pool is None:
+        # Spawned workers: forking after numba has run can hang at exit
+        pool = ProcessPoolExecutor(n_workers, mp_context=multiprocessing.get_context('spawn'))
+        _PROCESS_POOLS[n_workers] = pool
+    return pool
+
+
+def _relative_distances(centers: np.ndarray) -> np.ndarray:
+    """Distance of each center from the top-left of the centers' bounding box"""
+    if len(centers) == 0:
+        return np.zeros(0)
+    return np.linalg.norm(centers - centers.min(axis=0), axis=1)
+
+
+def _prepare(features: Union[List[StrokeFeatures], PreparedFeatures]) -> PreparedFeatures:
+    """Stack per-stroke features into a PreparedFeatures"""
+    if isinstance(features, PreparedFeatures):
+        return features
+    
+    centers = np.array([f.center for f in features], dtype=float).reshape(-1, 2)
+    
+    return PreparedFeatures(
+        centers=centers,
+        lengths=np.array([f.length for f in features], dtype=float),
+        angles=np.array([f.angle for f in features], dtype=float),
+        rel_dists=_relative_distances(centers),
+        start_points=np.array([f.start_point for f in features], dtype=float).reshape(-1, 2),
+        end_points=np.array([f.end_point for f in features], dtype=float).reshape(-1, 2)
+    )
+
 class GeneticAlgorithm:
     """
     Genetic Algorithm for stroke matching optimization
@@ -246,7 +510,12 @@ class GeneticAlgorithm:
                  crossover_rate: float = 0.8,
                  mutation_rate: float = 0.1,
                  tournament_size: int = 3,
-                 convergence_generations: int = 10):
+                 convergence_generations: int = 10,
+                 n_workers: int = 1,
+                 executor: Optional[Executor] = None,
+                 cache_fitness: bool = False,
+                 early_exit: bool = False,
+                 seed: Optional[int] = None):
         """
         Args:
             n_written: Number of written strokes
@@ -258,6 +527,18 @@ class GeneticAlgorithm:
             mutation_rate: Probability of mutation per gene
             tournament_size: Tournament size for selection
             convergence_generations: Stop if no improvement for this many gens
+            n_workers: Number of worker processes for fitness evaluation
+                      (1 evaluates in this process); the pool is started
+                      once and reused by later runs
+            executor: Executor to evaluate fitness on instead of the shared
+                     process pool; it is not shut down by evolve()
+            cache_fitness: Reuse distances of chromosomes seen in recent
+                          generations (pays off for expensive fitness functions)
+            early_exit: Stop evaluating a chromosome once it is worse than
+                       every chromosome of the previous generation (numba
+                       kernel only; such chromosomes report a lower bound)
+            seed: Seed for the GA's random generator (default: drawn from
+                 the global np.random state, so np.random.seed still applies)
         """
         self.n_written = n_written
         self.n_reference = n_reference
@@ -268,6 +549,17 @@ class GeneticAlgorithm:
         self.mutation_rate = mutation_rate
         self.tournament_size = tournament_size
         self.convergence_generations = convergence_generations
+        self.n_workers = n_workers
+        self.executor = executor
+        self.cache_fitness = cache_fitness
+        self.early_exit = early_exit
+        if seed is None:
+            seed = np.random.randint(2**32)
+        self.rng = np.random.default_rng(seed)
+        
+        # Distance of recently seen chromosomes (LRU, keyed by row bytes)
+        self._fitness_cache = OrderedDict()
+        self._fitness_cache_size = 4 * self.population_size
         
         # Evolution tracking
         self.best_fitness_history = []
@@ -287,63 +579,191 @@ class GeneticAlgorithm:
         
         if diff == 0:
             # Equal strokes: permutation
-            chromosome = list(range(1, self.n_reference + 1))
-            np.random.shuffle(chromosome)
+            chromosome = (self.rng.permutation(self.n_reference) + 1).tolist()
         elif diff > 0:
             # More written than reference: some map to 0 (extra strokes)
-            valid_refs = list(range(1, self.n_reference + 1))
-            extras = [0] * diff
-            chromosome = valid_refs + extras
-            np.random.shuffle(chromosome)
+            valid_refs = np.arange(1, self.n_reference + 1)
+            extras = np.zeros(diff, dtype=valid_refs.dtype)
+            chromosome = self.rng.permutation(np.concatenate((valid_refs, extras))).tolist()
         else:
             # Fewer written than reference: some written may map to same reference
-            chromosome = np.random.randint(1, self.n_reference + 1, size=self.n_written).tolist()
+            chromosome = self.rng.integers(1, self.n_reference + 1, size=self.n_written).tolist()
         
         return chromosome
     
+    def create_population(self, population_size: int) -> np.ndarray:
+        """
+        Create a random population
+        
+        Returns:
+            (population_size, n_written) int16 array, one chromosome per row
+        """
+        shape = (population_size, self.n_written)
+        diff = self.n_written - self.n_reference
+        
+        if diff < 0:
+            # Fewer written than reference: some written may map to same reference
+            return self.rng.integers(1, self.n_reference + 1, size=shape, dtype=np.int16)
+        
+        # Every row holds 1..n_reference plus diff zeros (extra strokes),
+        # each row shuffled independently
+        base = np.zeros(self.n_written, dtype=np.int16)
+        base[:self.n_reference] = np.arange(1, self.n_reference + 1)
+        return self.rng.permuted(np.broadcast_to(base, shape), axis=1)
+    
     def evaluate_chromosome(self, chromosome: List[int], 
-                           written_features: List[StrokeFeatures],
-                           reference_features: List[StrokeFeatures]) -> float:
+                           written_features: Union[List[StrokeFeatures], PreparedFeatures],
+                           reference_features: Union[List[StrokeFeatures], PreparedFeatures]) -> float:
         """Evaluate fitness of a chromosome"""
         distance = self.fitness_func.compute_distance(
             written_features, reference_features, chromosome
         )
         return self.fitness_func.compute_fitness(distance)
     
-    def tournament_selection(self, population: List[List[int]], 
-                            fitnesses: List[float]) -> List[int]:
-        """Select parent using tournament selection"""
-        tournament_indices = np.random.choice(len(population), 
-                                             self.tournament_size, 
-                                             replace=False)
-        tournament = [(population[i], fitnesses[i]) for i in tournament_indices]
-        winner = max(tournament, key=lambda x: x[1])
-        return winner[0].copy()
-    
-    def crossover(self, parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
-        """Single-point crossover"""
-        if len(parent1) < 2:
-            return parent1.copy(), parent2.copy()
-        
-        if np.random.random() < self.crossover_rate:
-            point = np.random.randint(1, len(parent1))
-            child1 = parent1[:point] + parent2[point:]
-            child2 = parent2[:point] + parent1[point:]
-            return child1, child2
-        else:
-            return parent1.copy(), parent2.copy()
-    
-    def mutate(self, chromosome: List[int]) -> List[int]:
-        """Random mutation"""
-        mutated = chromosome.copy()
-        for i in range(len(mutated)):
-            if np.random.random() < self.mutation_rate:
-                # Mutate to random valid value
-                mutated[i] = np.random.randint(0, self.n_reference + 1)
+    def tournament_selection(self, population: np.ndarray, 
+                            fitnesses: List[float]) -> np.ndarray:
+        """
+        Select parent using tournament selection
+        
+        Single-draw fallback for the batched tournament in evolve. The
+        tournament_size distinct candidates are drawn directly with
+        rejection on collisions, which is cheap since the tournament is
+        much smaller than the population.
+        """
+        n = len(population)
+        if self.tournament_size > n:
+            raise ValueError("Cannot take a larger sample than population")
+        
+        tournament_indices = []
+        while len(tournament_indices) < self.tournament_size:
+            i = int(self.rng.integers(n))
+            if i not in tournament_indices:
+                tournament_indices.append(i)
+        
+        winner = max(tournament_indices, key=lambda i: fitnesses[i])
+        return population[winner].copy()
+    
+    def _batched_tournament(self, fitnesses: np.ndarray, n_winners: int) -> np.ndarray:
+        """
+        Run n_winners tournaments at once
+        
+        Candidates are drawn with replacement, which for tournament_size
+        much smaller than the population behaves like the per-call version.
+        
+        Returns:
+            (n_winners,) array of population row indices
+        """
+        candidates = self.rng.integers(0, len(fitnesses),
+                                       size=(n_winners, self.tournament_size))
+        best = fitnesses[candidates].argmax(axis=1)
+        return candidates[np.arange(n_winners), best]
+    
+    def crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Single-point crossover
+        
+        Works on a single pair of chromosomes or on (n_pairs, n_written)
+        parent matrices: each row pair crosses over independently with
+        probability crossover_rate at its own random point.
+        """
+        parents1 = np.atleast_2d(parent1)
+        parents2 = np.atleast_2d(parent2)
+        n_pairs, n_genes = parents1.shape
+        if n_genes < 2:
+            return np.array(parent1), np.array(parent2)
+        
+        do_cross = self.rng.random(n_pairs) < self.crossover_rate
+        points = self.rng.integers(1, n_genes, size=n_pairs)
+        # Genes before the crossover point come from the first parent
+        mask = (np.arange(n_genes)[None, :] < points[:, None]) & do_cross[:, None]
+        child1 = np.where(mask, parents1, parents2)
+        child2 = np.where(mask, parents2, parents1)
+        
+        if np.ndim(parent1) == 1:
+            return child1[0], child2[0]
+        return child1, child2
+    
+    def mutate(self, chromosome: np.ndarray) -> np.ndarray:
+        """
+        Random mutation
+        
+        Works on a single chromosome or a whole (P, n_written) population:
+        every gene is independently replaced with probability mutation_rate.
+        """
+        mutated = np.array(chromosome, dtype=np.int16)
+        self._mutate_in_place(mutated)
         return mutated
     
-    def evolve(self, written_features: List[StrokeFeatures],
-               reference_features: List[StrokeFeatures]) -> Dict:
+    def _mutate_in_place(self, chromosomes: np.ndarray):
+        """Random mutation, applied directly to the given array"""
+        mask = self.rng.random(chromosomes.shape) < self.mutation_rate
+        # Mutate to random valid value
+        chromosomes[mask] = self.rng.integers(0, self.n_reference + 1, size=mask.sum())
+    
+    def evaluate_population(self, population: np.ndarray,
+                            written: PreparedFeatures,
+                            reference: PreparedFeatures,
+                            executor: Optional[Executor] = None,
+                            threshold: float = np.inf) -> np.ndarray:
+        """
+        Compute the distance of every chromosome in the population
+        
+        With cache_fitness, chromosomes evaluated recently (elites and
+        unchanged survivors) are served from the cache and only the rest
+        are computed. With an executor those are split into row chunks and
+        evaluated in parallel, since chromosomes are independent.
+        Distances above threshold may be partial (see
+        FitnessFunction.compute_population_distance).
+        
+        Returns:
+            (P,) array of total distances (lower is better)
+        """
+        if not self.cache_fitness:
+            return self._compute_distances(population, written, reference, executor, threshold)
+        
+        cache = self._fitness_cache
+        keys = [row.tobytes() for row in np.ascontiguousarray(population)]
+        distances = np.empty(len(population))
+        misses = []
+        for i, key in enumerate(keys):
+            distance = cache.get(key)
+            if distance is None:
+                misses.append(i)
+            else:
+                cache.move_to_end(key)
+                distances[i] = distance
+        
+        if misses:
+            computed = self._compute_distances(population[misses], written, reference,
+                                               executor, threshold)
+            distances[misses] = computed
+            for i, distance in zip(misses, computed.tolist()):
+                if distance <= threshold:  # Partial sums are not exact
+                    cache[keys[i]] = distance
+            while len(cache) > self._fitness_cache_size:
+                cache.popitem(last=False)
+        
+        return distances
+    
+    def _compute_distances(self, population: np.ndarray,
+                           written: PreparedFeatures,
+                           reference: PreparedFeatures,
+                           executor: Optional[Executor],
+                           threshold: float = np.inf) -> np.ndarray:
+        """Distances for population rows, split over the executor if there is one"""
+        if executor is None:
+            return self.fitness_func.compute_population_distance(written, reference, population,
+                                                                 threshold=threshold)
+        
+        n_workers = max(1, self.n_workers)
+        n_chunks = min(len(population), 4 * n_workers)
+        chunks = np.array_split(population, n_chunks)
+        results = executor.map(_evaluate_chunk, repeat(self.fitness_func),
+                               repeat(written), repeat(reference), chunks, repeat(threshold))
+        return np.concatenate(list(results))
+    
+    def evolve(self, written_features: Union[List[StrokeFeatures], PreparedFeatures],
+               reference_features: Union[List[StrokeFeatures], PreparedFeatures]) -> Dict:
         """
         Run genetic algorithm evolution
         
@@ -351,29 +771,63 @@ class GeneticAlgorithm:
             Dict with 'mapping', 'fitness', 'generations', 'history'
         """
         # Initialize population
-        population = [self.create_chromosome() for _ in range(self.population_size)]
-        
+        population = self.create_population(self.population_size)
+        
+        # Features are constant for the whole run, so prepare them once
+        written, reference = self.fitness_func.prepare(written_features, reference_features)
+        # Cached distances are only valid for these features
+        self._fitness_cache.clear()
+        
+        executor = self.executor
+        if executor is None and self.n_workers > 1:
+            executor = _shared_process_pool(self.n_workers)
+            try:
+                return self._evolve(population, written, reference, executor)
+            except BrokenProcessPool:
+                # A dead worker breaks the pool for good, start afresh next run
+                _PROCESS_POOLS.pop(self.n_workers, None)
+                raise
+        elif executor is not None and not isinstance(executor, ProcessPoolExecutor):
+            # Warm start: compile/load the distance kernel in this thread, so
+            # thread-pool workers never race to initialize it
+            _evaluate_chunk(self.fitness_func, written, reference, population[:1])
+        
+        return self._evolve(population, written, reference, executor)
+    
+    def _evolve(self, population: np.ndarray,
+                written: PreparedFeatures,
+                reference: PreparedFeatures,
+                executor: Optional[Executor]) -> Dict:
+        """Generation loop of evolve()"""
         best_chromosome = None
         best_fitness = 0.0
         generations_without_improvement = 0
         
+        # Double buffer: each generation is written into the spare matrix,
+        # then the two are swapped
+        next_population = np.empty_like(population)
+        threshold = np.inf
+        
         for generation in range(self.max_generations):
-            # Evaluate fitness for all chromosomes
-            fitnesses = [
-                self.evaluate_chromosome(chrom, written_features, reference_features)
-                for chrom in population
-            ]
+            # Evaluate fitness for all chromosomes in one vectorized pass
+            distances = self.evaluate_population(population, written, reference,
+                                                 executor, threshold)
+            if self.early_exit:
+                # Anything worse than this whole generation need not be exact
+                threshold = float(distances.max())
+            fitnesses = self.fitness_func.compute_fitness(distances)
             
             # Track statistics
-            gen_best_fitness = max(fitnesses)
-            gen_avg_fitness = np.mean(fitnesses)
+            best_idx = int(fitnesses.argmax())
+            gen_best_fitness = float(fitnesses[best_idx])
+            gen_avg_fitness = float(fitnesses.mean())
             self.best_fitness_history.append(gen_best_fitness)
             self.avg_fitness_history.append(gen_avg_fitness)
             
             # Update best solution (elitism)
             if gen_best_fitness > best_fitness:
                 best_fitness = gen_best_fitness
-                best_chromosome = population[fitnesses.index(gen_best_fitness)].copy()
+                best_chromosome = population[best_idx].copy()
                 generations_without_improvement = 0
             else:
                 generations_without_improvement += 1
@@ -383,29 +837,30 @@ class GeneticAlgorithm:
                 break
             
             # Create new population
-            new_population = [best_chromosome.copy()]  # Elitism
+            n_children = self.population_size - 1
+            n_pairs = (n_children + 1) // 2
+            
+            # Selection, all tournaments for this generation at once
+            parent_idx = self._batched_tournament(fitnesses, 2 * n_pairs)
+            
+            # Crossover, for all pairs at once; children fill the rows after
+            # the elite in pair order
+            child1, child2 = self.crossover(population[parent_idx[0::2]],
+                                            population[parent_idx[1::2]])
+            next_population[0] = best_chromosome  # Elitism
+            next_population[1::2] = child1
+            next_population[2::2] = child2[:len(next_population[2::2])]
             
-            while len(new_population) < self.population_size:
-                # Selection
-                parent1 = self.tournament_selection(population, fitnesses)
-                parent2 = self.tournament_selection(population, fitnesses)
-                
-                # Crossover
-                child1, child2 = self.crossover(parent1, parent2)
-                
-                # Mutation
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
-                
-                new_population.extend([child1, child2])
+            # Mutation, for all children at once
+            self._mutate_in_place(next_population[1:])
             
-            population = new_population[:self.population_size]
+            population, next_population = next_population, population
         
         self.best_chromosome = best_chromosome
         self.best_fitness = best_fitness
         
         return {
-            'mapping': best_chromosome,
+            'mapping': best_chromosome.tolist() if best_chromosome is not None else None,
             'fitness': best_fitness,
             'generations': len(self.best_fitness_history),
             'history': {
@@ -429,8 +884,8 @@ class ErrorDetector:
     
     def detect_errors(self,
                      mapping: List[int],
-                     written_features: List[StrokeFeatures],
-                     reference_features: List[StrokeFeatures]) -> List[Dict]:
+                     written_features: Union[List[StrokeFeatures], PreparedFeatures],
+                     reference_features: Union[List[StrokeFeatures], PreparedFeatures]) -> List[Dict]:
         """
         Detect all types of errors from mapping
         
@@ -442,6 +897,8 @@ class ErrorDetector:
         Returns:
             List of error dictionaries with 'type', 'description', 'indices'
         """
+        written_features = _prepare(written_features)
+        reference_features = _prepare(reference_features)
         errors = []
         
         # Step 1: Check concatenated/redundant strokes
@@ -534,52 +991,57 @@ class ErrorDetector:
     
     def _check_orientation(self,
                           mapping: List[int],
-                          written_features: List[StrokeFeatures],
-                          reference_features: List[StrokeFeatures]) -> List[Dict]:
+                          written_features: PreparedFeatures,
+                          reference_features: PreparedFeatures) -> List[Dict]:
         """Check for orientation errors"""
         errors = []
-        
-        for written_idx, ref_idx in enumerate(mapping):
-            if ref_idx == 0 or ref_idx > len(reference_features):
-                continue
-            
-            written_feat = written_features[written_idx]
-            ref_feat = reference_features[ref_idx - 1]
-            
-            angle_diff = abs(written_feat.angle - ref_feat.angle)
-            if angle_diff > np.pi:
-                angle_diff = 2 * np.pi - angle_diff
-            
-            if angle_diff > self.angle_threshold:
-                errors.append({
-                    'type': 'ORIENTATION',
-                    'description': f"Orientation error: written stroke {written_idx} " +
-                                 f"(angle {np.degrees(written_feat.angle):.1f}°) vs " +
-                                 f"reference {ref_idx-1} (angle {np.degrees(ref_feat.angle):.1f}°)",
-                    'written_indices': [written_idx],
-                    'reference_index': ref_idx - 1,
-                    'angle_diff_degrees': np.degrees(angle_diff)
-                })
+        m = np.asarray(mapping, dtype=np.int64)
+        n_reference = len(reference_features)
+        if n_reference == 0:
+            return errors
+        
+        valid = (m > 0) & (m <= n_reference)
+        idx = np.clip(m - 1, 0, n_reference - 1)
+        written_angles = written_features.angles[:len(m)]
+        ref_angles = reference_features.angles[idx]
+        
+        angle_diff = np.abs(written_angles - ref_angles)
+        angle_diff = np.where(angle_diff > np.pi, 2 * np.pi - angle_diff, angle_diff)
+        bad = valid & (angle_diff > self.angle_threshold)
+        
+        for written_idx in np.nonzero(bad)[0].tolist():
+            ref_idx = int(m[written_idx])
+            errors.append({
+                'type': 'ORIENTATION',
+                'description': f"Orientation error: written stroke {written_idx} " +
+                             f"(angle {np.degrees(written_angles[written_idx]):.1f}°) vs " +
+                             f"reference {ref_idx-1} (angle {np.degrees(ref_angles[written_idx]):.1f}°)",
+                'written_indices': [written_idx],
+                'reference_index': ref_idx - 1,
+                'angle_diff_degrees': np.degrees(angle_diff[written_idx])
+            })
         
         return errors
     
     def _check_order(self, mapping: List[int]) -> List[Dict]:
         """Check for stroke order errors"""
         errors = []
+        m = np.asarray(mapping, dtype=np.int64)
         
-        for written_idx, ref_idx in enumerate(mapping):
-            if ref_idx > 0:
-                # Expected: written_idx should match ref_idx-1 (0-indexed)
-                expected_ref = written_idx + 1
-                if ref_idx != expected_ref:
-                    errors.append({
-                        'type': 'ORDER',
-                        'description': f"Order error: written stroke {written_idx} " +
-                                     f"should be at position {ref_idx-1} (maps to reference {ref_idx-1})",
-                        'written_indices': [written_idx],
-                        'reference_index': ref_idx - 1,
-                        'expected_position': ref_idx - 1
-                    })
+        # Expected: written_idx should match ref_idx-1 (0-indexed)
+        expected_ref = np.arange(1, len(m) + 1)
+        bad = (m > 0) & (m != expected_ref)
+        
+        for written_idx in np.nonzero(bad)[0].tolist():
+            ref_idx = int(m[written_idx])
+            errors.append({
+                'type': 'ORDER',
+                'description': f"Order error: written stroke {written_idx} " +
+                             f"should be at position {ref_idx-1} (maps to reference {ref_idx-1})",
+                'written_indices': [written_idx],
+                'reference_index': ref_idx - 1,
+                'expected_position': ref_idx - 1
+            })
         
         return errors
 
@@ -597,7 +1059,10 @@ class StrokeMatcher:
                  population_size: Optional[int] = None,
                  max_generations: int = 100,
                  angle_threshold: float = np.pi / 4,
-                 normalize: bool = True):
+                 normalize: bool = True,
+                 n_workers: int = 1,
+                 executor: Optional[Executor] = None,
+                 seed: Optional[int] = None):
         """
         Args:
             alpha, beta, gamma, epsilon: Fitness function weights
@@ -605,6 +1070,10 @@ class StrokeMatcher:
             max_generations: Maximum GA generations
             angle_threshold: Threshold for orientation errors (radians)
             normalize: Whether to normalize coordinates
+            n_workers: Worker processes for GA fitness evaluation
+            executor: Executor for GA fitness evaluation instead of the
+                     module's shared process pool
+            seed: Seed for the GA's random generator
         """
         self.alpha = alpha
         self.beta = beta
@@ -614,6 +1083,9 @@ class StrokeMatcher:
         self.max_generations = max_generations
         self.angle_threshold = angle_threshold
         self.normalize = normalize
+        self.n_workers = n_workers
+        self.executor = executor
+        self.seed = seed
         
         self.normalizer = StrokeNormalizer()
         self.feature_extractor = StrokeFeatureExtractor()
@@ -628,8 +1100,10 @@ class StrokeMatcher:
         Complete stroke matching pipeline
         
         Args:
-            written_strokes: List of (2, 50) or (k, 50) arrays (student's writing)
-            reference_strokes: List of (2, 50) or (k, 50) arrays (correct template)
+            written_strokes: List of (2, 50) or (k, 50) arrays, or one (S, k, 50)
+                array (student's writing)
+            reference_strokes: List of (2, 50) or (k, 50) arrays, or one (S, k, 50)
+                array (correct template)
             verbose: Print progress information
             
         Returns:
@@ -645,20 +1119,18 @@ class StrokeMatcher:
         if verbose:
             print(f"Matching {len(written_strokes)} written strokes to {len(reference_strokes)} reference strokes")
         
-        # Step 1: Normalize coordinates
+        # Steps 1-2: Normalize coordinates and extract features in one pass,
+        # all strokes of each character at once
         if self.normalize:
-            written_norm, written_meta = self.normalizer.normalize(written_strokes)
-            reference_norm, reference_meta = self.normalizer.normalize(reference_strokes)
+            written_meta = self.normalizer.compute_metadata(written_strokes)
+            reference_meta = self.normalizer.compute_metadata(reference_strokes)
             if verbose:
                 print(f"  Normalized to [0, 100] range")
         else:
-            written_norm = written_strokes
-            reference_norm = reference_strokes
             written_meta = reference_meta = {}
         
-        # Step 2: Extract features
-        written_features = [self.feature_extractor.extract(s) for s in written_norm]
-        reference_features = [self.feature_extractor.extract(s) for s in reference_norm]
+        written_features = self.feature_extractor.extract_batch(written_strokes, written_meta)
+        reference_features = self.feature_extractor.extract_batch(reference_strokes, reference_meta)
         if verbose:
             print(f"  Extracted features (center, length, angle, etc.)")
         
@@ -668,7 +1140,10 @@ class StrokeMatcher:
             n_reference=len(reference_strokes),
             fitness_func=self.fitness_func,
             population_size=self.population_size,
-            max_generations=self.max_generations
+            max_generations=self.max_generations,
+            n_workers=self.n_workers,
+            executor=self.executor,
+            seed=self.seed
         )
         
         if verbose:
@@ -0,0 +1,168 @@
+"""
+Tests for the data loading and preprocessing helpers in Autograder_Util
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+import Autograder_Util
+from Autograder_Util import (
+    build_ref_cache,
+    invert_y_axis,
+    load_character_data,
+    load_ref_dataset,
+    normalize_character,
+    preprocess_characters,
+    resample_characters,
+    resample_characters_dense,
+    resample_stroke,
+)
+
+
+def _write_ref_dataset(directory, entries=None):
+    """Write a reference dataset (default: two characters) and return its path."""
+    path = os.path.join(directory, "refs.txt")
+    if entries is None:
+        entries = [
+            {"character": "a", "medians": [[[0, 0], [10, 10]], [[5, 0], [5, 10]]]},
+            {"character": "b", "medians": [[[1, 2], [3, 4], [5, 6]]]},
+        ]
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    return path
+
+
+def test_load_ref_dataset_returns_writable_copies():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_ref_dataset(directory)
+
+        (strokes,) = load_ref_dataset(path, ["a"])
+        assert strokes[0].flags.writeable
+        strokes[0][0] = [99, 99]
+
+        # Editing a returned stroke must not leak into later calls
+        (strokes_again,) = load_ref_dataset(path, ["a"])
+        assert strokes_again[0] is not strokes[0]
+        np.testing.assert_array_equal(strokes_again[0], [[0, 0], [10, 10]])
+
+
+def test_ref_cache_round_trip_after_rebuild():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_ref_dataset(directory)
+        cache_path = os.path.join(directory, "cache")
+
+        build_ref_cache(path, cache_path)
+        a, b = load_ref_dataset(path, ["a", "b"], cache_path=cache_path)
+        np.testing.assert_array_equal(a[1], [[5, 0], [5, 10]])
+        np.testing.assert_array_equal(b[0], [[1, 2], [3, 4], [5, 6]])
+
+        # Rebuild from a changed dataset while the old cache is mapped
+        path = _write_ref_dataset(
+            directory, [{"character": "c", "medians": [[[7, 8], [9, 10]]]}]
+        )
+        build_ref_cache(path, cache_path)
+        a, c = load_ref_dataset(path, ["a", "c"], cache_path=cache_path)
+        assert a is None
+        np.testing.assert_array_equal(c[0], [[7, 8], [9, 10]])
+
+
+def test_ref_cache_older_than_dataset_is_ignored():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_ref_dataset(directory)
+        cache_path = os.path.join(directory, "cache")
+        build_ref_cache(path, cache_path)
+
+        # Dataset edited after the cache was built
+        path = _write_ref_dataset(
+            directory, [{"character": "a", "medians": [[[1, 1], [2, 2]]]}]
+        )
+        index_mtime = os.stat(os.path.join(cache_path, "index.npz")).st_mtime
+        os.utime(path, (index_mtime + 10, index_mtime + 10))
+
+        (a,) = load_ref_dataset(path, ["a"], cache_path=cache_path)
+        np.testing.assert_array_equal(a[0], [[1, 1], [2, 2]])
+
+
+def test_load_character_data_header_only():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chars.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("character,stroke,x,y\n")
+
+        chars, unique_chars = load_character_data(path)
+        assert chars == []
+        assert len(unique_chars) == 0
+
+
+def test_resample_characters_dense_empty_stroke():
+    stroke = np.array([[10.0, 10.0], [20.0, 20.0]])
+    data, stroke_counts = resample_characters_dense([[np.zeros((0, 2)), stroke]], 50)
+    np.testing.assert_array_equal(stroke_counts, [2])
+    assert np.isnan(data[0, 0]).all()
+
+    # The empty stroke must not affect how the other strokes normalize
+    (with_empty,) = preprocess_characters([[np.zeros((0, 2)), stroke]])
+    (without_empty,) = preprocess_characters([[stroke]])
+    np.testing.assert_allclose(with_empty[1], without_empty[0])
+    np.testing.assert_allclose(with_empty[1][[0, -1]], [[0, 1], [1, 0]])
+
+
+def _random_chars(seed=0):
+    """Characters of random-walk strokes with ragged point counts."""
+    rng = np.random.default_rng(seed)
+    chars = [
+        [
+            np.cumsum(rng.normal(size=(rng.integers(2, 40), 2)), axis=0)
+            for _ in range(rng.integers(1, 6))
+        ]
+        for _ in range(8)
+    ]
+    # Repeated points give zero-length segments
+    chars[0][0] = np.repeat(chars[0][0], 2, axis=0)
+    return chars
+
+
+def _check_resample_characters():
+    chars = _random_chars()
+    resampled = resample_characters(chars, num_pts=50)
+    for char_strokes, resampled_strokes in zip(chars, resampled):
+        for stroke, resampled_stroke in zip(char_strokes, resampled_strokes):
+            np.testing.assert_allclose(
+                resampled_stroke, resample_stroke(stroke, 50), rtol=1e-9, atol=1e-9
+            )
+
+
+def test_resample_characters_matches_resample_stroke():
+    _check_resample_characters()
+
+
+def test_resample_characters_matches_resample_stroke_without_numba():
+    kernel = Autograder_Util._resample_flat_nb
+    Autograder_Util._resample_flat_nb = None
+    try:
+        _check_resample_characters()
+    finally:
+        Autograder_Util._resample_flat_nb = kernel
+
+
+def test_preprocess_characters_matches_scalar_pipeline():
+    chars = _random_chars(seed=1)
+    expected = invert_y_axis(
+        normalize_character(
+            [[resample_stroke(stroke, 50) for stroke in strokes] for strokes in chars]
+        )
+    )
+    for char_strokes, expected_strokes in zip(preprocess_characters(chars), expected):
+        for stroke, expected_stroke in zip(char_strokes, expected_strokes):
+            np.testing.assert_allclose(stroke, expected_stroke, atol=1e-5)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
@@ -0,0 +1,128 @@
+"""
+Unit tests for the genetic algorithm in stroke_matcher
+"""
+
+import numpy as np
+import stroke_matcher
+from stroke_matcher import (ErrorDetector, FitnessFunction, GeneticAlgorithm,
+                            StrokeFeatureExtractor, StrokeNormalizer)
+
+
+def _features(n_strokes: int = 3):
+    """Features of n_strokes straight (2, 50) strokes"""
+    extractor = StrokeFeatureExtractor()
+    t = np.linspace(0, 1, 50)
+    strokes = [np.array([t * 10 + i * 20, t * 5]) for i in range(n_strokes)]
+    return [extractor.extract(stroke) for stroke in strokes]
+
+
+def _random_strokes(n_strokes: int, seed: int):
+    """n_strokes random-walk (2, 50) strokes"""
+    rng = np.random.default_rng(seed)
+    return [np.cumsum(rng.normal(size=(2, 50)), axis=1) + rng.uniform(0, 100, (2, 1))
+            for _ in range(n_strokes)]
+
+
+def _check_population_distance(parallel: bool):
+    """compute_population_distance matches compute_distance row by row"""
+    extractor = StrokeFeatureExtractor()
+    written = [extractor.extract(s) for s in _random_strokes(5, seed=0)]
+    reference = [extractor.extract(s) for s in _random_strokes(4, seed=1)]
+    fitness = FitnessFunction(alpha=1.0, beta=0.5, gamma=2.0, epsilon=0.3)
+    
+    # Include unmatched (0) and out of range (> n_reference) entries
+    rng = np.random.default_rng(2)
+    mapping_matrix = rng.integers(0, len(reference) + 2, size=(64, len(written)))
+    
+    w, r = fitness.prepare(written, reference)
+    distances = fitness.compute_population_distance(w, r, mapping_matrix, parallel=parallel)
+    expected = [fitness.compute_distance(written, reference, row.tolist())
+                for row in mapping_matrix]
+    
+    np.testing.assert_allclose(distances, expected, rtol=1e-9)
+
+
+def test_population_distance_matches_scalar():
+    for parallel in (True, False):
+        _check_population_distance(parallel)
+
+
+def test_population_distance_matches_scalar_without_numba():
+    kernels = (stroke_matcher._population_distance_nb,
+               stroke_matcher._population_distance_serial_nb)
+    stroke_matcher._population_distance_nb = None
+    stroke_matcher._population_distance_serial_nb = None
+    try:
+        _check_population_distance(parallel=False)
+    finally:
+        (stroke_matcher._population_distance_nb,
+         stroke_matcher._population_distance_serial_nb) = kernels
+
+
+def test_extract_batch_matches_normalize_then_extract():
+    strokes = _random_strokes(4, seed=3)
+    normalizer = StrokeNormalizer()
+    extractor = StrokeFeatureExtractor()
+    
+    batch = extractor.extract_batch(strokes, normalizer.compute_metadata(strokes))
+    normalized, _ = normalizer.normalize(strokes)
+    expected = FitnessFunction().prepare([extractor.extract(s) for s in normalized], [])[0]
+    
+    for field in ('centers', 'lengths', 'angles', 'rel_dists', 'start_points', 'end_points'):
+        np.testing.assert_allclose(getattr(batch, field), getattr(expected, field),
+                                   rtol=1e-9, atol=1e-9, err_msg=field)
+
+
+def test_error_checks_match_scalar():
+    """Vectorized orientation and order checks flag the same strokes as a per-stroke loop"""
+    extractor = StrokeFeatureExtractor()
+    written = [extractor.extract(s) for s in _random_strokes(6, seed=4)]
+    reference = [extractor.extract(s) for s in _random_strokes(5, seed=5)]
+    detector = ErrorDetector()
+    w, r = FitnessFunction().prepare(written, reference)
+    
+    rng = np.random.default_rng(6)
+    for _ in range(20):
+        mapping = rng.integers(0, len(reference) + 2, size=len(written)).tolist()
+        
+        expected_orientation = []
+        expected_order = []
+        for written_idx, ref_idx in enumerate(mapping):
+            if ref_idx > 0 and ref_idx != written_idx + 1:
+                expected_order.append((written_idx, ref_idx - 1))
+            if ref_idx == 0 or ref_idx > len(reference):
+                continue
+            angle_diff = abs(written[written_idx].angle - reference[ref_idx - 1].angle)
+            if angle_diff > np.pi:
+                angle_diff = 2 * np.pi - angle_diff
+            if angle_diff > detector.angle_threshold:
+                expected_orientation.append((written_idx, ref_idx - 1, np.degrees(angle_diff)))
+        
+        orientation = [(e['written_indices'][0], e['reference_index'], e['angle_diff_degrees'])
+                       for e in detector._check_orientation(mapping, w, r)]
+        order = [(e['written_indices'][0], e['reference_index'])
+                 for e in detector._check_order(mapping)]
+        
+        assert [o[:2] for o in orientation] == [o[:2] for o in expected_orientation]
+        np.testing.assert_allclose([o[2] for o in orientation],
+                                   [o[2] for o in expected_orientation])
+        assert order == expected_order
+
+
+def test_zero_generations():
+    """With no generations to run, evolve returns no mapping"""
+    features = _features()
+    ga = GeneticAlgorithm(3, 3, FitnessFunction(), seed=1, max_generations=0)
+    
+    result = ga.evolve(features, features)
+    
+    assert result['mapping'] is None
+    assert result['fitness'] == 0.0
+    assert result['generations'] == 0
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
@@ -4,36 +4,79 @@ With realistic stochastic motor noise and deliberate errors
 """
 
 import numpy as np
+import io
 import json
+import mmap
+import multiprocessing
+import os
+import re
 import sys
+import time
+import traceback
 sys.path.append('/home/claude')
 from stroke_matcher import StrokeMatcher
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # ============================================================================
 # SVG PATH PARSER
 # ============================================================================
 
-def parse_svg_path_to_points(path_str: str, n_points: int = 50) -> np.ndarray:
+# Path tokens: single command letters and numbers. Every letter is its own
+# token so unsupported commands (e.g. C) are still skipped one by one
+_TOKEN_RE = re.compile(r'[A-Za-z]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+# Points sampled per path command, to size the point buffer up front
+_SEGMENT_POINTS = {'M': 1, 'L': 5, 'Q': 10, 'Z': 3, 'z': 3}
+
+# Sample positions along L (5), Q (10) and Z (3) segments and along a
+# 50-point stroke, plus the quadratic Bezier basis at the Q positions
+_T5 = np.linspace(0, 1, 5)
+_T10 = np.linspace(0, 1, 10)
+_T3 = np.linspace(0, 1, 3)
+_T50 = np.linspace(0, 1, 50)
+_B10 = np.stack([(1-_T10)**2, 2*(1-_T10)*_T10, _T10**2])  # (3, 10)
+_B10_MAT = np.ascontiguousarray(_B10.T)  # (10, 3)
+for _const in (_T5, _T10, _T3, _T50, _B10, _B10_MAT):
+    _const.setflags(write=False)
+del _const
+
+# Token codes for the compiled sampler: path commands, numbers, and other
+# letters (unsupported commands, skipped)
+_CMD_M, _CMD_L, _CMD_Q, _CMD_Z, _CMD_NUM, _CMD_SKIP = range(6)
+_TOKEN_CODES = {'M': _CMD_M, 'L': _CMD_L, 'Q': _CMD_Q, 'Z': _CMD_Z, 'z': _CMD_Z}
+
+# Random source for motor noise and error injection (reseeded by the suite)
+_RNG = np.random.default_rng(42)
+
+
+def _sample_path_tokens(tokens: List[str], points: np.ndarray) -> int:
     """
-    Parse SVG path string to (2, n_points) array
-    
-    Simplified parser for M (moveto), L (lineto), Q (quadratic), Z (close) commands
+    Sample the path given by tokens into points, in Python
     
     Args:
-        path_str: SVG path string like "M 100 200 L 300 400 Z"
-        n_points: Number of points to sample along the path
+        tokens: Path tokens from _TOKEN_RE
+        points: (max_pts, 2) output buffer, sized from _SEGMENT_POINTS
         
     Returns:
-        (2, n_points) array with x, y coordinates
+        Number of points written (at least 2)
     """
-    # Parse commands
-    path_str = path_str.strip()
-    tokens = path_str.replace(',', ' ').split()
-    
-    points = []
-    current_pos = np.array([0.0, 0.0])
-    start_pos = np.array([0.0, 0.0])
+    k = 0
+    cur_x, cur_y = 0.0, 0.0
+    start_x, start_y = 0.0, 0.0
     i = 0
     
     while i < len(tokens):
@@ -41,101 +84,265 @@ def parse_svg_path_to_points(path_str: str, n_points: int = 50) -> np.ndarray:
         
         if cmd == 'M':  # Move to
             x, y = float(tokens[i+1]), float(tokens[i+2])
-            current_pos = np.array([x, y])
-            start_pos = current_pos.copy()
-            points.append(current_pos.copy())
+            cur_x, cur_y = start_x, start_y = x, y
+            points[k, 0] = x
+            points[k, 1] = y
+            k += 1
             i += 3
             
         elif cmd == 'L':  # Line to
             x, y = float(tokens[i+1]), float(tokens[i+2])
-            new_pos = np.array([x, y])
             # Interpolate between current and new position
-            for t in np.linspace(0, 1, 5):
-                points.append(current_pos * (1-t) + new_pos * t)
-            current_pos = new_pos
+            points[k:k+5, 0] = cur_x * (1-_T5) + x * _T5
+            points[k:k+5, 1] = cur_y * (1-_T5) + y * _T5
+            k += 5
+            cur_x, cur_y = x, y
             i += 3
             
         elif cmd == 'Q':  # Quadratic Bezier
             cx, cy = float(tokens[i+1]), float(tokens[i+2])
             x, y = float(tokens[i+3]), float(tokens[i+4])
-            control = np.array([cx, cy])
-            end = np.array([x, y])
-            # Sample quadratic curve
-            for t in np.linspace(0, 1, 10):
-                pt = (1-t)**2 * current_pos + 2*(1-t)*t * control + t**2 * end
-                points.append(pt)
-            current_pos = end
+            # Sample quadratic curve: (10, 3) basis @ (3, 2) control points
+            points[k:k+10] = _B10_MAT @ np.array([[cur_x, cur_y], [cx, cy], [x, y]])
+            k += 10
+            cur_x, cur_y = x, y
             i += 5
             
         elif cmd == 'Z' or cmd == 'z':  # Close path
             # Line back to start
-            for t in np.linspace(0, 1, 3):
-                points.append(current_pos * (1-t) + start_pos * t)
-            current_pos = start_pos.copy()
+            points[k:k+3, 0] = cur_x * (1-_T3) + start_x * _T3
+            points[k:k+3, 1] = cur_y * (1-_T3) + start_y * _T3
+            k += 3
+            cur_x, cur_y = start_x, start_y
             i += 1
             
         else:
             # Skip unknown commands
             i += 1
     
-    # Convert to array and resample to exactly n_points
-    if len(points) < 2:
+    if k < 2:
         # Fallback: create a point stroke
-        points = [start_pos, start_pos]
+        points[:2] = (start_x, start_y)
+        k = 2
     
-    points_array = np.array(points)
+    return k
+
+
+def _sample_path_kernel(codes: np.ndarray, nums: np.ndarray, points: np.ndarray) -> int:
+    """
+    Sample the path given by token codes into points, in scalar loops
     
-    # Resample to n_points using linear interpolation
-    from scipy.interpolate import interp1d
+    Same walk as _sample_path_tokens, written so numba can compile it.
     
-    old_indices = np.linspace(0, 1, len(points_array))
+    Args:
+        codes: (n_tokens,) int8 token codes (_CMD_*)
+        nums: (n_tokens,) values of the number tokens
+        points: (max_pts, 2) output buffer, sized from _SEGMENT_POINTS
+        
+    Returns:
+        Number of points written (at least 2), or -1 when a command is
+        missing arguments (callers then fall back to the Python parser)
+    """
+    n_tokens = codes.shape[0]
+    k = 0
+    cur_x = 0.0
+    cur_y = 0.0
+    start_x = 0.0
+    start_y = 0.0
+    i = 0
+    
+    while i < n_tokens:
+        cmd = codes[i]
+        
+        if cmd == _CMD_M or cmd == _CMD_L:
+            if i + 2 >= n_tokens or codes[i+1] != _CMD_NUM or codes[i+2] != _CMD_NUM:
+                return -1
+            x = nums[i+1]
+            y = nums[i+2]
+            if cmd == _CMD_M:  # Move to
+                start_x = x
+                start_y = y
+                points[k, 0] = x
+                points[k, 1] = y
+                k += 1
+            else:  # Line to
+                for m in range(5):
+                    t = _T5[m]
+                    points[k, 0] = cur_x * (1-t) + x * t
+                    points[k, 1] = cur_y * (1-t) + y * t
+                    k += 1
+            cur_x = x
+            cur_y = y
+            i += 3
+            
+        elif cmd == _CMD_Q:  # Quadratic Bezier
+            if i + 4 >= n_tokens:
+                return -1
+            for a in range(1, 5):
+                if codes[i+a] != _CMD_NUM:
+                    return -1
+            cx = nums[i+1]
+            cy = nums[i+2]
+            x = nums[i+3]
+            y = nums[i+4]
+            for m in range(10):
+                points[k, 0] = _B10[0, m] * cur_x + _B10[1, m] * cx + _B10[2, m] * x
+                points[k, 1] = _B10[0, m] * cur_y + _B10[1, m] * cy + _B10[2, m] * y
+                k += 1
+            cur_x = x
+            cur_y = y
+            i += 5
+            
+        elif cmd == _CMD_Z:  # Close path
+            for m in range(3):
+                t = _T3[m]
+                points[k, 0] = cur_x * (1-t) + start_x * t
+                points[k, 1] = cur_y * (1-t) + start_y * t
+                k += 1
+            cur_x = start_x
+            cur_y = start_y
+            i += 1
+            
+        else:
+            # Skip unknown commands
+            i += 1
+    
+    if k < 2:
+        # Fallback: create a point stroke
+        for m in range(2):
+            points[m, 0] = start_x
+            points[m, 1] = start_y
+        k = 2
+    
+    return k
+
+
+if njit is not None:
+    _sample_path_nb = njit(cache=True)(_sample_path_kernel)
+else:
+    _sample_path_nb = None
+
+
+def parse_svg_path_to_points(path_str: str, n_points: int = 50,
+                             dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Parse SVG path string to (2, n_points) array
+    
+    Simplified parser for M (moveto), L (lineto), Q (quadratic), Z (close) commands
+    
+    Args:
+        path_str: SVG path string like "M 100 200 L 300 400 Z"
+        n_points: Number of points to sample along the path
+        dtype: Output dtype (e.g. np.float32 to halve memory traffic);
+               sampling is always done in float64
+        
+    Returns:
+        (2, n_points) array with x, y coordinates
+    """
+    # Parse commands
+    tokens = _TOKEN_RE.findall(path_str)
+    
+    # Preallocate for the upper bound of sampled points
+    max_pts = sum(_SEGMENT_POINTS.get(token, 0) for token in tokens)
+    points = np.empty((max(max_pts, 2), 2))
+    
+    k = -1
+    if _sample_path_nb is not None:
+        codes = np.array([_TOKEN_CODES.get(token, _CMD_SKIP if token.isalpha() else _CMD_NUM)
+                          for token in tokens], dtype=np.int8)
+        nums = np.array([0.0 if token.isalpha() else float(token) for token in tokens])
+        k = _sample_path_nb(codes, nums, points)
+    if k < 0:
+        # Malformed path: the Python walk raises the usual errors
+        k = _sample_path_tokens(tokens, points)
+    
+    # Resample to n_points using linear interpolation
+    old_indices = np.linspace(0, 1, k)
     new_indices = np.linspace(0, 1, n_points)
     
-    f_x = interp1d(old_indices, points_array[:, 0], kind='linear')
-    f_y = interp1d(old_indices, points_array[:, 1], kind='linear')
+    x_resampled = np.interp(new_indices, old_indices, points[:k, 0])
+    y_resampled = np.interp(new_indices, old_indices, points[:k, 1])
     
-    x_resampled = f_x(new_indices)
-    y_resampled = f_y(new_indices)
+    return np.array([x_resampled, y_resampled], dtype=dtype)
+
+
+_GRAPHICS_PATH = '/mnt/user-data/uploads/graphics.txt'
+
+# graphics.txt mapped into memory with its line offsets, and parsed
+# characters, filled on first use
+_GRAPHICS_MM = None
+_LINE_STARTS = None
+_LINE_ENDS = None
+_PARSED_CACHE = {}
+
+
+def _graphics_lines() -> Tuple[mmap.mmap, np.ndarray, np.ndarray]:
+    """
+    Map graphics.txt read-only and index its lines, once per process
     
-    return np.array([x_resampled, y_resampled])
+    Returns:
+        (mapped file, line start offsets, line end offsets)
+    """
+    global _GRAPHICS_MM, _LINE_STARTS, _LINE_ENDS
+    
+    if _GRAPHICS_MM is None:
+        with open(_GRAPHICS_PATH, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # One newline scan for the offset table (~80 KB for 10k lines)
+        newlines = np.flatnonzero(np.frombuffer(mm, dtype=np.uint8) == 0x0A)
+        ends = newlines if mm[-1:] == b'\n' else np.append(newlines, len(mm))
+        _LINE_STARTS = np.concatenate([[0], newlines + 1])[:len(ends)]
+        _LINE_ENDS = ends
+        _GRAPHICS_MM = mm
+    
+    return _GRAPHICS_MM, _LINE_STARTS, _LINE_ENDS
 
 
-def load_character_from_graphics(character_index: int = 0) -> Tuple[str, List[np.ndarray]]:
+def load_character_from_graphics(character_index: int = 0,
+                                  dtype: np.dtype = np.float64) -> Tuple[str, np.ndarray]:
     """
     Load a character from graphics.txt
     
     Args:
         character_index: Index of character to load (0-9569)
+        dtype: dtype of the returned strokes
         
     Returns:
-        (character_name, list of strokes as (2, 50) arrays)
+        (character_name, (S, 2, 50) array of strokes)
     """
-    with open('/mnt/user-data/uploads/graphics.txt', 'r') as f:
-        lines = f.readlines()
-    
-    if character_index >= len(lines):
-        character_index = character_index % len(lines)
+    mm, line_starts, line_ends = _graphics_lines()
     
-    data = json.loads(lines[character_index].strip())
+    if character_index >= len(line_starts):
+        character_index = character_index % len(line_starts)
     
-    character_name = data['character']
-    strokes = []
-    
-    for svg_path in data['strokes']:
-        stroke = parse_svg_path_to_points(svg_path, n_points=50)
-        strokes.append(stroke)
+    if character_index not in _PARSED_CACHE:
+        # Only the requested line is copied out of the mapping
+        line = mm[line_starts[character_index]:line_ends[character_index]]
+        data = _json_loads(line)
+        
+        character_name = data['character']
+        strokes = np.empty((len(data['strokes']), 2, 50))
+        
+        for i, svg_path in enumerate(data['strokes']):
+            strokes[i] = parse_svg_path_to_points(svg_path, n_points=50)
+        
+        _PARSED_CACHE[character_index] = (character_name, strokes)
     
-    return character_name, strokes
+    # Hand out a copy so callers can mutate it freely
+    character_name, strokes = _PARSED_CACHE[character_index]
+    return character_name, strokes.astype(dtype)
 
 
 # ============================================================================
 # MOTOR NOISE SIMULATION
 # ============================================================================
 
-def add_motor_noise(strokes: List[np.ndarray], 
+def add_motor_noise(strokes: Union[np.ndarray, List[np.ndarray]], 
                    position_noise: float = 2.0,
                    temporal_noise: float = 0.5,
-                   tremor_freq: float = 0.3) -> List[np.ndarray]:
+                   tremor_freq: float = 0.3,
+                   dtype: Optional[np.dtype] = None) -> np.ndarray:
     """
     Add realistic stochastic motor noise to strokes
     
@@ -145,149 +352,174 @@ def add_motor_noise(strokes: List[np.ndarray],
     - Tremor (low-frequency oscillation)
     
     Args:
-        strokes: List of clean (2, 50) stroke arrays
+        strokes: (S, 2, 50) array or list of clean (2, 50) strokes
         position_noise: Std dev of position noise (pixels)
         temporal_noise: Std dev of temporal jitter (0-1 range)
         tremor_freq: Frequency of tremor oscillation
+        dtype: Output dtype (None: that of the strokes, float64 for
+               integer strokes); noise is always computed in float64
         
     Returns:
-        List of noisy strokes
+        (S, 2, n) array of noisy strokes (a list if point counts differ)
     """
-    noisy_strokes = []
+    if len(strokes) == 0:
+        return np.empty((0, 2, 50), dtype=dtype or np.float64)
+    
+    # All strokes as one (S, 2, n) tensor
+    if isinstance(strokes, np.ndarray):
+        arr = strokes[:, :2, :]
+    elif len(set(stroke.shape[1] for stroke in strokes)) > 1:
+        # Ragged point counts cannot be stacked, add noise stroke by stroke
+        return [add_motor_noise([stroke], position_noise, temporal_noise, tremor_freq,
+                                dtype)[0]
+                for stroke in strokes]
+    else:
+        arr = np.stack([stroke[:2, :] for stroke in strokes])
+    n_strokes, _, n = arr.shape
+    if dtype is None:
+        dtype = arr.dtype if np.issubdtype(arr.dtype, np.floating) else np.float64
+    
+    # Per stroke: x position noise, y position noise, temporal jitter
+    # (same draw order as generating them stroke by stroke)
+    draws = _RNG.standard_normal((n_strokes, 3, n))
+    
+    # 1. Position noise (Gaussian)
+    pos_noise = draws[:, :2, :] * position_noise
+    
+    # 2. Tremor (sinusoidal at low frequency), shared by all strokes
+    t = _T50 if n == 50 else np.linspace(0, 1, n)
+    tremor = np.stack([np.sin(2 * np.pi * tremor_freq * t),
+                       np.cos(2 * np.pi * tremor_freq * t)]) * position_noise * 0.5
+    
+    # 3. Temporal jitter (slight warping of time axis)
+    t_jittered = t + draws[:, 2, :] * temporal_noise / n
+    t_jittered = np.clip(t_jittered, 0, 1)
+    t_jittered = np.sort(t_jittered, axis=1)  # Keep monotonic
+    
+    # Interpolate with jittered time, batched np.interp over all strokes
+    # (t_jittered is clipped to the range of t, so no extrapolation)
+    if n > 1:
+        j = np.clip(np.searchsorted(t, t_jittered, side='right') - 1, 0, n - 2)
+        x0 = np.take_along_axis(arr, j[:, None, :], axis=2)
+        x1 = np.take_along_axis(arr, j[:, None, :] + 1, axis=2)
+        slope = (x1 - x0) / (t[j + 1] - t[j])[:, None, :]
+        warped = slope * (t_jittered - t[j])[:, None, :] + x0
+    else:
+        warped = arr.astype(float)
     
-    for stroke in strokes:
-        x, y = stroke[0, :], stroke[1, :]
-        n = len(x)
-        
-        # 1. Position noise (Gaussian)
-        x_noise = np.random.randn(n) * position_noise
-        y_noise = np.random.randn(n) * position_noise
-        
-        # 2. Tremor (sinusoidal at low frequency)
-        t = np.linspace(0, 1, n)
-        tremor_x = np.sin(2 * np.pi * tremor_freq * t) * position_noise * 0.5
-        tremor_y = np.cos(2 * np.pi * tremor_freq * t) * position_noise * 0.5
-        
-        # 3. Temporal jitter (slight warping of time axis)
-        t_jittered = t + np.random.randn(n) * temporal_noise / n
-        t_jittered = np.clip(t_jittered, 0, 1)
-        t_jittered = np.sort(t_jittered)  # Keep monotonic
-        
-        # Interpolate with jittered time
-        from scipy.interpolate import interp1d
-        f_x = interp1d(t, x, kind='linear', fill_value='extrapolate')
-        f_y = interp1d(t, y, kind='linear', fill_value='extrapolate')
-        
-        x_warped = f_x(t_jittered)
-        y_warped = f_y(t_jittered)
-        
-        # Combine all noise sources
-        x_noisy = x_warped + x_noise + tremor_x
-        y_noisy = y_warped + y_noise + tremor_y
-        
-        noisy_strokes.append(np.array([x_noisy, y_noisy]))
+    # Combine all noise sources
+    noisy = warped + pos_noise + tremor
     
-    return noisy_strokes
+    return noisy.astype(dtype, copy=False)
 
 
 # ============================================================================
 # ERROR INJECTION
 # ============================================================================
 
-def inject_order_error(strokes: List[np.ndarray], 
-                      n_swaps: int = 2) -> Tuple[List[np.ndarray], str]:
+# Every inject_* takes the strokes as an (S, 2, n) array (or a list of
+# equally sized strokes) and returns a new array; the input is never modified
+
+# Benchmark mode (AUTOGRADER_FAST=1/true/yes): skip the stroke-count checks
+# in inject_missing_stroke, inject_extra_stroke and inject_orientation_error,
+# the caller guarantees enough strokes
+_FAST = os.environ.get('AUTOGRADER_FAST', '').lower() in ('1', 'true', 'yes')
+
+def inject_order_error(strokes: np.ndarray, 
+                      n_swaps: int = 2) -> Tuple[np.ndarray, str]:
     """Swap random pairs of strokes"""
-    strokes = strokes.copy()
+    strokes = np.asarray(strokes)
+    order = np.arange(len(strokes))
     swapped_pairs = []
     
     for _ in range(min(n_swaps, len(strokes) // 2)):
-        i, j = np.random.choice(len(strokes), size=2, replace=False)
-        strokes[i], strokes[j] = strokes[j], strokes[i]
+        i, j = _RNG.choice(len(strokes), size=2, replace=False)
+        order[[i, j]] = order[[j, i]]
         swapped_pairs.append((i, j))
     
-    return strokes, f"Swapped stroke pairs: {swapped_pairs}"
+    return strokes[order], f"Swapped stroke pairs: {swapped_pairs}"
 
 
-def inject_missing_stroke(strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], str]:
+def inject_missing_stroke(strokes: np.ndarray) -> Tuple[np.ndarray, str]:
     """Remove a random stroke"""
-    if len(strokes) <= 1:
-        return strokes, "Cannot remove stroke (too few)"
+    strokes = np.asarray(strokes)
+    if not _FAST and len(strokes) <= 1:
+        return strokes.copy(), "Cannot remove stroke (too few)"
     
-    idx = np.random.randint(0, len(strokes))
-    removed = strokes.pop(idx)
+    idx = _RNG.integers(0, len(strokes))
+    strokes = np.delete(strokes, idx, axis=0)
     return strokes, f"Removed stroke {idx}"
 
 
-def inject_extra_stroke(strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], str]:
-    """Add an extra stroke (random or duplicate)"""
-    if len(strokes) == 0:
-        return strokes, "Cannot add extra (no strokes)"
+def inject_extra_stroke(strokes: np.ndarray,
+                        dtype: Optional[np.dtype] = None) -> Tuple[np.ndarray, str]:
+    """Add an extra stroke (random or duplicate), as dtype (None: keep the strokes' dtype)"""
+    strokes = np.asarray(strokes, dtype=dtype)
+    if not _FAST and len(strokes) == 0:
+        return strokes.copy(), "Cannot add extra (no strokes)"
     
     # 50% chance: duplicate existing stroke with perturbation
     # 50% chance: random stroke in character bounding box
-    if np.random.random() < 0.5:
+    if _RNG.random() < 0.5:
         # Duplicate + perturb
-        idx = np.random.randint(0, len(strokes))
-        extra = strokes[idx].copy()
-        extra += np.random.randn(*extra.shape) * 5  # Add noise
-        insert_pos = np.random.randint(0, len(strokes) + 1)
-        strokes.insert(insert_pos, extra)
+        idx = _RNG.integers(0, len(strokes))
+        extra = strokes[idx] + _RNG.standard_normal(strokes[idx].shape) * 5  # Add noise
+        insert_pos = _RNG.integers(0, len(strokes) + 1)
+        strokes = np.insert(strokes, insert_pos, extra, axis=0)
         return strokes, f"Added duplicate of stroke {idx} at position {insert_pos}"
     else:
-        # Random stroke
-        all_x = np.concatenate([s[0, :] for s in strokes])
-        all_y = np.concatenate([s[1, :] for s in strokes])
-        x_min, x_max = all_x.min(), all_x.max()
-        y_min, y_max = all_y.min(), all_y.max()
+        # Random stroke, in the bounding box of all strokes
+        x_min, x_max = strokes[:, 0].min(), strokes[:, 0].max()
+        y_min, y_max = strokes[:, 1].min(), strokes[:, 1].max()
         
         # Random line in bounding box
-        start = np.array([np.random.uniform(x_min, x_max), 
-                         np.random.uniform(y_min, y_max)])
-        end = np.array([np.random.uniform(x_min, x_max),
-                       np.random.uniform(y_min, y_max)])
+        start = np.array([_RNG.uniform(x_min, x_max), 
+                         _RNG.uniform(y_min, y_max)])
+        end = np.array([_RNG.uniform(x_min, x_max),
+                       _RNG.uniform(y_min, y_max)])
         
-        extra = np.array([np.linspace(start[0], end[0], 50),
-                         np.linspace(start[1], end[1], 50)])
+        n = strokes.shape[2]
+        extra = np.array([np.linspace(start[0], end[0], n),
+                         np.linspace(start[1], end[1], n)])
         
-        insert_pos = np.random.randint(0, len(strokes) + 1)
-        strokes.insert(insert_pos, extra)
+        insert_pos = _RNG.integers(0, len(strokes) + 1)
+        strokes = np.insert(strokes, insert_pos, extra, axis=0)
         return strokes, f"Added random stroke at position {insert_pos}"
 
 
-def inject_orientation_error(strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], str]:
+def inject_orientation_error(strokes: np.ndarray) -> Tuple[np.ndarray, str]:
     """Reverse direction of a random stroke"""
-    if len(strokes) == 0:
-        return strokes, "No strokes to reverse"
+    strokes = np.asarray(strokes)
+    if not _FAST and len(strokes) == 0:
+        return strokes.copy(), "No strokes to reverse"
     
-    idx = np.random.randint(0, len(strokes))
-    strokes[idx] = np.flip(strokes[idx], axis=1)  # Reverse point order
-    return strokes, f"Reversed stroke {idx} direction"
+    idx = _RNG.integers(0, len(strokes))
+    reversed_strokes = strokes.copy()
+    reversed_strokes[idx] = strokes[idx, :, ::-1]  # Reverse point order
+    return reversed_strokes, f"Reversed stroke {idx} direction"
 
 
-def inject_broken_stroke(strokes: List[np.ndarray]) -> Tuple[List[np.ndarray], str]:
+def inject_broken_stroke(strokes: np.ndarray) -> Tuple[np.ndarray, str]:
     """Split a stroke into two parts"""
+    strokes = np.asarray(strokes)
     if len(strokes) == 0:
-        return strokes, "No strokes to break"
+        return strokes.copy(), "No strokes to break"
     
-    idx = np.random.randint(0, len(strokes))
+    idx = _RNG.integers(0, len(strokes))
     stroke = strokes[idx]
+    n = stroke.shape[1]
     
     # Split at random point (not too close to ends)
-    split_point = np.random.randint(15, 35)
-    
-    part1 = stroke[:, :split_point+1]
-    part2 = stroke[:, split_point:]
+    split_point = _RNG.integers(15, 35)
     
-    # Pad to 50 points each
-    def pad_to_50(s):
-        if s.shape[1] < 50:
-            last = s[:, -1:]
-            padding = np.repeat(last, 50 - s.shape[1], axis=1)
-            return np.concatenate([s, padding], axis=1)
-        return s[:, :50]
+    # Both halves padded to n points, repeating their last point
+    halves = np.empty((2,) + stroke.shape, dtype=strokes.dtype)
+    for half, part in zip(halves, (stroke[:, :split_point+1], stroke[:, split_point:])):
+        k = min(part.shape[1], n)
+        half[:, :k] = part[:, :k]
+        half[:, k:] = part[:, k-1:k]
     
-    strokes[idx] = pad_to_50(part1)
-    strokes.insert(idx + 1, pad_to_50(part2))
+    strokes = np.concatenate([strokes[:idx], halves, strokes[idx+1:]])
     
     return strokes, f"Broke stroke {idx} into two at point {split_point}"
 
@@ -368,7 +600,10 @@ def test_realistic_missing_stroke():
     print(f"Strokes: {len(reference)}")
     
     written = add_motor_noise(reference, position_noise=2.5)
+    n_written = len(written)
+    assert n_written > 1, "Too few strokes to remove one"
     written, error_desc = inject_missing_stroke(written)
+    assert len(written) == n_written - 1, "No stroke was removed"
     print(f"Injected: {error_desc}")
     print(f"Written strokes: {len(written)}")
     
@@ -399,7 +634,10 @@ def test_realistic_extra_stroke():
     print(f"Strokes: {len(reference)}")
     
     written = add_motor_noise(reference, position_noise=2.5)
+    n_written = len(written)
+    assert n_written > 0, "No strokes to add an extra one to"
     written, error_desc = inject_extra_stroke(written)
+    assert len(written) == n_written + 1, "No stroke was added"
     print(f"Injected: {error_desc}")
     print(f"Written strokes: {len(written)}")
     
@@ -430,6 +668,7 @@ def test_realistic_orientation_error():
     print(f"Strokes: {len(reference)}")
     
     written = add_motor_noise(reference, position_noise=2.5)
+    assert len(written) > 0, "No strokes to reverse"
     written, error_desc = inject_orientation_error(written)
     print(f"Injected: {error_desc}")
     
@@ -500,11 +739,11 @@ def test_realistic_multiple_errors():
         written, desc = inject_order_error(written, n_swaps=1)
         errors_injected.append(desc)
     
-    if len(written) >= 2 and np.random.random() < 0.5:
+    if len(written) >= 2 and _RNG.random() < 0.5:
         written, desc = inject_orientation_error(written)
         errors_injected.append(desc)
     
-    if len(written) >= 4 and np.random.random() < 0.3:
+    if len(written) >= 4 and _RNG.random() < 0.3:
         written, desc = inject_missing_stroke(written)
         errors_injected.append(desc)
     
@@ -552,11 +791,10 @@ def test_realistic_complex_character():
     written = add_motor_noise(reference, position_noise=2.0, temporal_noise=0.3)
     
     # Maybe inject one error
-    if np.random.random() < 0.5 and len(written) >= 4:
+    if _RNG.random() < 0.5 and len(written) >= 4:
         written, desc = inject_order_error(written, n_swaps=1)
         print(f"Injected: {desc}")
     
-    import time
     start = time.time()
     
     matcher = StrokeMatcher(normalize=True)
@@ -578,14 +816,50 @@ def test_realistic_complex_character():
     return result
 
 
-def run_realistic_test_suite():
-    """Run all realistic tests"""
+def _run_test(test_func: Callable, seed: int) -> Tuple[str, str, Optional[Dict], str]:
+    """
+    Run one test with its own seed, capturing what it prints
+    
+    Args:
+        test_func: Test function to run
+        seed: Seed for _RNG and for the global state the matcher seeds from
+        
+    Returns:
+        (test name, status, result or None, captured output)
+    """
+    global _RNG
+    _RNG = np.random.default_rng(seed)  # For reproducibility
+    np.random.seed(seed)  # Matcher seeds are still drawn from the global state
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            result = test_func()
+            status = "PASS"
+        except Exception as e:
+            print(f"✗ FAIL: {e}\n")
+            traceback.print_exc(file=output)
+            result = None
+            status = f"FAIL: {e}"
+    
+    return test_func.__name__, status, result, output.getvalue()
+
+
+def run_realistic_test_suite(n_workers: Optional[int] = None):
+    """
+    Run all realistic tests
+    
+    Tests are independent and run in parallel worker processes, each seeded
+    with 42 + its index. Their output is printed in test order.
+    
+    Args:
+        n_workers: Worker processes (None: one per CPU, at most one per
+                   test; 1: run in this process)
+    """
     print("\n" + "=" * 70)
     print("REALISTIC TEST SUITE - Using graphics.txt + Motor Noise")
     print("=" * 70 + "\n")
     
-    np.random.seed(42)  # For reproducibility
-    
     tests = [
         test_realistic_perfect_match,
         test_realistic_order_error,
@@ -597,16 +871,22 @@ def run_realistic_test_suite():
         test_realistic_complex_character,
     ]
     
+    seeds = [42 + i for i in range(len(tests))]
+    if n_workers is None:
+        n_workers = min(len(tests), os.cpu_count() or 1)
+    
+    if n_workers > 1:
+        # Spawned workers: forking after numba has run can hang at exit
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            runs = list(executor.map(_run_test, tests, seeds))
+    else:
+        runs = [_run_test(test_func, seed) for test_func, seed in zip(tests, seeds)]
+    
     results = []
-    for test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_func.__name__, "PASS", result))
-        except Exception as e:
-            print(f"✗ FAIL: {e}\n")
-            import traceback
-            traceback.print_exc()
-            results.append((test_func.__name__, f"FAIL: {e}", None))
+    for name, status, result, output in runs:
+        print(output, end="")
+        results.append((name, status, result))
     
     # Summary
     print("\n" + "=" * 70)